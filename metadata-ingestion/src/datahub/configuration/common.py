@@ -1,12 +1,24 @@
+import functools
 import re
 import unittest.mock
 from abc import ABC, abstractmethod
 from enum import auto
-from typing import IO, Any, ClassVar, Dict, List, Optional, Type, TypeVar
+from typing import (
+    IO,
+    Any,
+    ClassVar,
+    Dict,
+    List,
+    Optional,
+    Pattern,
+    Tuple,
+    Type,
+    TypeVar,
+)
 
 import pydantic
 from cached_property import cached_property
-from pydantic import BaseModel, Extra, ValidationError
+from pydantic import BaseModel, Extra, PrivateAttr, ValidationError
 from pydantic.fields import Field
 from typing_extensions import Protocol, runtime_checkable
 
@@ -187,6 +199,51 @@ class ConfigurationMechanism(ABC):
         pass
 
 
+# Patterns using group references, conditionals or global inline flags would change
+# meaning once combined with other patterns, so those are always matched one by one.
+_UNCOMBINABLE_PATTERN = re.compile(r"\\[1-9]|\(\?P=|\(\?\(|\(\?[aiLmsux]+\)")
+
+
+@functools.lru_cache(maxsize=1024)
+def _combine_patterns(patterns: Tuple[str, ...], flags: int) -> Optional[Pattern]:
+    if not patterns or any(_UNCOMBINABLE_PATTERN.search(p) for p in patterns):
+        return None
+    try:
+        # An invalid pattern can still compile once wrapped and combined, e.g.
+        # "a)|(?:b". Those are left to the per-pattern path, which raises the error.
+        for p in patterns:
+            re.compile(p, flags)
+        return re.compile("|".join(f"(?:{p})" for p in patterns), flags)
+    except re.error:
+        return None
+
+
+class _PatternMatcher:
+    """Matches strings against any of a list of regexes.
+
+    A single combined regex is much faster than trying each pattern in turn when
+    there are many patterns, so it is built once and reused for as long as the
+    patterns stay the same.
+    """
+
+    def __init__(self) -> None:
+        self._state: Optional[Tuple[List[str], int, Optional[Pattern]]] = None
+
+    def matches(self, patterns: List[str], string: str, flags: int) -> bool:
+        # Pattern lists are sometimes extended after the config is parsed, so the
+        # combined regex is rebuilt whenever they change. The state is replaced as
+        # a whole so that concurrent callers always see a consistent one.
+        state = self._state
+        if state is None or state[1] != flags or state[0] != patterns:
+            state = (list(patterns), flags, _combine_patterns(tuple(patterns), flags))
+            self._state = state
+
+        combined = state[2]
+        if combined is not None:
+            return combined.match(string) is not None
+        return any(re.match(pattern, string, flags) for pattern in patterns)
+
+
 class AllowDenyPattern(ConfigModel):
     """A class to store allow deny regexes"""
 
@@ -209,6 +266,9 @@ class AllowDenyPattern(ConfigModel):
         description="Whether to ignore case sensitivity during pattern matching.",
     )  # Name comparisons should default to ignoring case
 
+    _allow_matcher: _PatternMatcher = PrivateAttr(default_factory=_PatternMatcher)
+    _deny_matcher: _PatternMatcher = PrivateAttr(default_factory=_PatternMatcher)
+
     @property
     def regex_flags(self) -> int:
         return re.IGNORECASE if self.ignoreCase else 0
@@ -218,14 +278,16 @@ class AllowDenyPattern(ConfigModel):
         return AllowDenyPattern()
 
     def allowed(self, string: str) -> bool:
-        for deny_pattern in self.deny:
-            if re.match(deny_pattern, string, self.regex_flags):
-                return False
+        if self.deny and self._deny_matcher.matches(
+            self.deny, string, self.regex_flags
+        ):
+            return False
 
-        return any(
-            re.match(allow_pattern, string, self.regex_flags)
-            for allow_pattern in self.allow
-        )
+        # The default allow pattern matches everything, no need to run it
+        if ".*" in self.allow:
+            return True
+
+        return self._allow_matcher.matches(self.allow, string, self.regex_flags)
 
     def is_fully_specified_allow_list(self) -> bool:
         """
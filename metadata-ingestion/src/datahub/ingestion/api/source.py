@@ -29,8 +29,7 @@ from datahub.ingestion.api.common import PipelineContext, RecordEnvelope, WorkUn
 from datahub.ingestion.api.report import Report
 from datahub.ingestion.api.source_helpers import (
     auto_browse_path_v2,
-    auto_materialize_referenced_tags,
-    auto_status_aspect,
+    auto_status_aspect_and_referenced_tags,
     auto_workunit_reporter,
 )
 from datahub.ingestion.api.workunit import MetadataWorkUnit
@@ -193,8 +192,7 @@ class Source(Closeable, metaclass=ABCMeta):
             )
 
         return [
-            auto_status_aspect,
-            auto_materialize_referenced_tags,
+            auto_status_aspect_and_referenced_tags,
             browse_path_processor,
             partial(auto_workunit_reporter, self.get_report()),
         ]
@@ -1,6 +1,8 @@
 import logging
 from typing import (
     TYPE_CHECKING,
+    AbstractSet,
+    Any,
     Callable,
     Dict,
     Iterable,
@@ -9,8 +11,10 @@ from typing import (
     Sequence,
     Set,
     Tuple,
+    Type,
     TypeVar,
     Union,
+    cast,
 )
 
 from datahub.emitter.mce_builder import make_dataplatform_instance_urn
@@ -25,6 +29,7 @@ from datahub.metadata.schema_classes import (
     MetadataChangeProposalClass,
     StatusClass,
     TagKeyClass,
+    _Aspect,
 )
 from datahub.telemetry import telemetry
 from datahub.utilities.urns.tag_urn import TagUrn
@@ -39,6 +44,10 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Checking the prefix is much cheaper than parsing the urn with guess_entity_type.
+_TAG_URN_PREFIX = "urn:li:tag:"
+_CONTAINER_URN_PREFIX = "urn:li:container:"
+
 
 def auto_workunit(
     stream: Iterable[Union[MetadataChangeEventClass, MetadataChangeProposalWrapper]]
@@ -52,45 +61,87 @@ def auto_workunit(
             yield item.as_workunit()
 
 
-def auto_status_aspect(
-    stream: Iterable[MetadataWorkUnit],
-) -> Iterable[MetadataWorkUnit]:
-    """
-    For all entities that don't have a status aspect, add one with removed set to false.
-    """
+def _mce_has_status(mce: MetadataChangeEventClass) -> bool:
+    # Generated aspect classes are never subclassed, so check exact types.
+    status_cls = StatusClass
+    for aspect in mce.proposedSnapshot.aspects:
+        if type(aspect) is status_cls:
+            return True
+    return False
 
-    all_urns: Set[str] = set()
-    status_urns: Set[str] = set()
-    for wu in stream:
+
+def _mcpw_has_status(mcpw: MetadataChangeProposalWrapper) -> bool:
+    return type(mcpw.aspect) is StatusClass
+
+
+def _mcpc_has_status(mcpc: MetadataChangeProposalClass) -> bool:
+    return mcpc.aspectName == StatusClass.ASPECT_NAME
+
+
+_STATUS_HANDLERS: Dict[type, Callable[[Any], bool]] = {
+    MetadataChangeEventClass: _mce_has_status,
+    MetadataChangeProposalWrapper: _mcpw_has_status,
+    MetadataChangeProposalClass: _mcpc_has_status,
+}
+
+
+def _get_status_handler(metadata: object) -> Callable[[Any], bool]:
+    # Exact type lookup first; only fall back to isinstance checks for subclasses.
+    handler = _STATUS_HANDLERS.get(type(metadata))
+    if handler is not None:
+        return handler
+
+    for cls, handler in _STATUS_HANDLERS.items():
+        if isinstance(metadata, cls):
+            return handler
+    raise ValueError(f"Unexpected type {type(metadata)}")
+
+
+class _StatusAspectTracker:
+    """Tracks the entities of a workunit stream that have no status aspect."""
+
+    def __init__(self) -> None:
+        # Dict used as an insertion-ordered set: the emitted status aspects follow
+        # stream order, without having to sort the (potentially very large) set of urns.
+        self.all_urns: Dict[str, None] = {}
+        self.status_urns: Set[str] = set()
+
+    def add(self, wu: MetadataWorkUnit) -> None:
         urn = wu.get_urn()
-        all_urns.add(urn)
+        self.all_urns[urn] = None
 
         if not wu.is_primary_source:
             # If this is a non-primary source, we pretend like we've seen the status
             # aspect so that we don't try to emit a removal for it.
-            status_urns.add(urn)
-        elif isinstance(wu.metadata, MetadataChangeEventClass):
-            if any(
-                isinstance(aspect, StatusClass)
-                for aspect in wu.metadata.proposedSnapshot.aspects
-            ):
-                status_urns.add(urn)
-        elif isinstance(wu.metadata, MetadataChangeProposalWrapper):
-            if isinstance(wu.metadata.aspect, StatusClass):
-                status_urns.add(urn)
-        elif isinstance(wu.metadata, MetadataChangeProposalClass):
-            if wu.metadata.aspectName == StatusClass.ASPECT_NAME:
-                status_urns.add(urn)
+            self.status_urns.add(urn)
         else:
-            raise ValueError(f"Unexpected type {type(wu.metadata)}")
+            metadata = wu.metadata
+            if _get_status_handler(metadata)(metadata):
+                self.status_urns.add(urn)
 
+    def gen_missing_status_workunits(self) -> Iterable[MetadataWorkUnit]:
+        for urn in self.all_urns:
+            if urn in self.status_urns:
+                continue
+            yield MetadataChangeProposalWrapper(
+                entityUrn=urn,
+                aspect=StatusClass(removed=False),
+            ).as_workunit()
+
+
+def auto_status_aspect(
+    stream: Iterable[MetadataWorkUnit],
+) -> Iterable[MetadataWorkUnit]:
+    """
+    For all entities that don't have a status aspect, add one with removed set to false.
+    """
+
+    tracker = _StatusAspectTracker()
+    for wu in stream:
+        tracker.add(wu)
         yield wu
 
-    for urn in sorted(all_urns - status_urns):
-        yield MetadataChangeProposalWrapper(
-            entityUrn=urn,
-            aspect=StatusClass(removed=False),
-        ).as_workunit()
+    yield from tracker.gen_missing_status_workunits()
 
 
 def _default_entity_type_fn(wu: MetadataWorkUnit) -> Optional[str]:
@@ -99,6 +150,9 @@ def _default_entity_type_fn(wu: MetadataWorkUnit) -> Optional[str]:
     return entity_type
 
 
+_STALE_ENTITY_BATCH_SIZE = 1024
+
+
 def auto_stale_entity_removal(
     stale_entity_removal_handler: "StaleEntityRemovalHandler",
     stream: Iterable[MetadataWorkUnit],
@@ -110,17 +164,42 @@ def auto_stale_entity_removal(
     Record all entities that are found, and emit removals for any that disappeared in this run.
     """
 
-    for wu in stream:
-        urn = wu.get_urn()
-
-        if wu.is_primary_source:
-            entity_type = entity_type_fn(wu)
-            if entity_type is not None:
-                stale_entity_removal_handler.add_entity_to_state(entity_type, urn)
-        else:
-            stale_entity_removal_handler.add_urn_to_skip(urn)
+    # Skip the call and the repeated urn lookup for the default entity type fn
+    use_default_entity_type = entity_type_fn is _default_entity_type_fn
+
+    # Buffered to amortize the per-call overhead of the handler
+    entities_batch: List[Tuple[str, str]] = []
+    urns_to_skip_batch: List[str] = []
+
+    try:
+        for wu in stream:
+            urn = wu.get_urn()
+
+            if wu.is_primary_source:
+                entity_type: Optional[str]
+                if use_default_entity_type:
+                    entity_type = guess_entity_type(urn)
+                else:
+                    entity_type = entity_type_fn(wu)
+                if entity_type is not None:
+                    entities_batch.append((entity_type, urn))
+                    if len(entities_batch) >= _STALE_ENTITY_BATCH_SIZE:
+                        stale_entity_removal_handler.add_entities_to_state_bulk(
+                            entities_batch
+                        )
+                        entities_batch.clear()
+            else:
+                urns_to_skip_batch.append(urn)
+                if len(urns_to_skip_batch) >= _STALE_ENTITY_BATCH_SIZE:
+                    stale_entity_removal_handler.add_urns_to_skip(urns_to_skip_batch)
+                    urns_to_skip_batch.clear()
 
-        yield wu
+            yield wu
+    finally:
+        # Every workunit that was handed out is recorded, even if the stream is
+        # closed early or fails
+        stale_entity_removal_handler.add_entities_to_state_bulk(entities_batch)
+        stale_entity_removal_handler.add_urns_to_skip(urns_to_skip_batch)
 
     # Clean up stale entities.
     yield from stale_entity_removal_handler.gen_removed_entity_workunits()
@@ -139,32 +218,71 @@ def auto_workunit_reporter(report: "SourceReport", stream: Iterable[T]) -> Itera
         yield wu
 
 
+class _ReferencedTagTracker:
+    """Tracks the tags referenced in a workunit stream that have no aspect of their own."""
+
+    def __init__(self) -> None:
+        # Insertion-ordered set, so that output follows order of first reference.
+        self.referenced_tags: Dict[str, None] = {}
+        self.tags_with_aspects: Set[str] = set()
+
+    def add(self, wu: MetadataWorkUnit) -> None:
+        for urn in list_urns(wu.metadata):
+            if urn.startswith(_TAG_URN_PREFIX):
+                self.referenced_tags[urn] = None
+
+        urn = wu.get_urn()
+        if urn.startswith(_TAG_URN_PREFIX):
+            self.tags_with_aspects.add(urn)
+
+    def gen_missing_tag_workunits(self) -> Iterable[MetadataWorkUnit]:
+        for urn in self.referenced_tags:
+            if urn in self.tags_with_aspects:
+                continue
+            tag_urn = TagUrn.create_from_string(urn)
+
+            yield MetadataChangeProposalWrapper(
+                entityUrn=urn,
+                aspect=TagKeyClass(name=tag_urn.get_entity_id()[0]),
+            ).as_workunit()
+
+
 def auto_materialize_referenced_tags(
     stream: Iterable[MetadataWorkUnit],
 ) -> Iterable[MetadataWorkUnit]:
     """For all references to tags, emit a tag key aspect to ensure that the tag exists in our backend."""
 
-    referenced_tags = set()
-    tags_with_aspects = set()
-
+    tracker = _ReferencedTagTracker()
     for wu in stream:
-        for urn in list_urns(wu.metadata):
-            if guess_entity_type(urn) == "tag":
-                referenced_tags.add(urn)
+        tracker.add(wu)
+        yield wu
 
-        urn = wu.get_urn()
-        if guess_entity_type(urn) == "tag":
-            tags_with_aspects.add(urn)
+    yield from tracker.gen_missing_tag_workunits()
 
+
+def auto_status_aspect_and_referenced_tags(
+    stream: Iterable[MetadataWorkUnit],
+) -> Iterable[MetadataWorkUnit]:
+    """Fused equivalent of ``auto_materialize_referenced_tags(auto_status_aspect(stream))``.
+
+    Goes through the stream once instead of once per processor. Emits the same
+    workunits, in the same order, as the two chained processors.
+    """
+
+    status_tracker = _StatusAspectTracker()
+    tag_tracker = _ReferencedTagTracker()
+    for wu in stream:
+        status_tracker.add(wu)
+        tag_tracker.add(wu)
         yield wu
 
-    for urn in sorted(referenced_tags - tags_with_aspects):
-        tag_urn = TagUrn.create_from_string(urn)
+    # Like in the chained processors, the generated status aspects are part of the
+    # stream the tags are materialized from
+    for wu in status_tracker.gen_missing_status_workunits():
+        tag_tracker.add(wu)
+        yield wu
 
-        yield MetadataChangeProposalWrapper(
-            entityUrn=urn,
-            aspect=TagKeyClass(name=tag_urn.get_entity_id()[0]),
-        ).as_workunit()
+    yield from tag_tracker.gen_missing_tag_workunits()
 
 
 def auto_browse_path_v2(
@@ -192,10 +310,12 @@ def auto_browse_path_v2(
     num_out_of_order = 0
     num_out_of_batch = 0
 
-    # Set for all containers and urns with a Container aspect
+    # Parent container of all urns with a Container aspect
     # Used to construct container paths while iterating through stream
     # Assumes topological order of entities in stream
-    paths: Dict[str, List[BrowsePathEntryClass]] = {}
+    parent_containers: Dict[str, str] = {}
+    # Entries are shared by the paths of all descendants of a container
+    container_entries: Dict[str, BrowsePathEntryClass] = {}
 
     emitted_urns: Set[str] = set()
     containers_used_as_parent: Set[str] = set()
@@ -209,22 +329,30 @@ def auto_browse_path_v2(
             if not wu.is_primary_source:
                 continue
 
-            container_aspect = wu.get_aspect_of_type(ContainerClass)
+            aspects = _get_aspects_by_type(wu, _BROWSE_PATH_ASPECT_TYPES)
+            if not aspects:
+                # Common case, e.g. for sources without containers or browse paths
+                continue
+
+            container_aspect = cast(
+                Optional[ContainerClass], aspects.get(ContainerClass)
+            )
             if container_aspect:
                 parent_urn = container_aspect.container
                 containers_used_as_parent.add(parent_urn)
-                paths[urn] = [
-                    *paths.setdefault(parent_urn, []),  # Guess parent has no parents
-                    BrowsePathEntryClass(id=parent_urn, urn=parent_urn),
-                ]
-                container_path = paths[urn]
+                parent_containers[urn] = parent_urn
+                container_path = _get_container_path(
+                    urn, parent_containers, container_entries
+                )
 
                 if urn in containers_used_as_parent:
-                    # Topological order invariant violated; we've used the previous value of paths[urn]
+                    # Topological order invariant violated; we've used the previous parent of urn
                     # TODO: Add sentry alert
                     num_out_of_order += 1
 
-            browse_path_aspect = wu.get_aspect_of_type(BrowsePathsClass)
+            browse_path_aspect = cast(
+                Optional[BrowsePathsClass], aspects.get(BrowsePathsClass)
+            )
             if browse_path_aspect and browse_path_aspect.paths:
                 legacy_path = [
                     BrowsePathEntryClass(id=p.strip())
@@ -232,7 +360,7 @@ def auto_browse_path_v2(
                     if p.strip() and p.strip() not in drop_dirs
                 ]
 
-            if wu.get_aspect_of_type(BrowsePathsV2Class):
+            if aspects.get(BrowsePathsV2Class):
                 has_browse_path_v2 = True
 
         path = container_path or legacy_path
@@ -253,7 +381,7 @@ def auto_browse_path_v2(
                         )
                     ),
                 ).as_workunit()
-        elif urn not in emitted_urns and guess_entity_type(urn) == "container":
+        elif urn not in emitted_urns and urn.startswith(_CONTAINER_URN_PREFIX):
             # Root containers have no Container aspect, so they are not handled above
             emitted_urns.add(urn)
             if not dry_run:
@@ -274,24 +402,102 @@ def auto_browse_path_v2(
         telemetry.telemetry_instance.ping("incorrect_browse_path_v2", properties)
 
 
+_BROWSE_PATH_ASPECT_TYPES = frozenset(
+    [ContainerClass, BrowsePathsClass, BrowsePathsV2Class]
+)
+
+
+def _get_aspects_by_type(
+    wu: MetadataWorkUnit, aspect_types: AbstractSet[Type[_Aspect]]
+) -> Dict[Type[_Aspect], _Aspect]:
+    """Equivalent to calling wu.get_aspect_of_type for each of aspect_types,
+    but in a single pass over the workunit's aspects.
+
+    Matches on exact aspect type, as generated aspect classes are not subclassed.
+    """
+    metadata = wu.metadata
+    if type(metadata) is MetadataChangeProposalWrapper:
+        # Fast path for the most common case: a single aspect
+        aspect = metadata.aspect
+        if aspect is not None and type(aspect) in aspect_types:
+            return {type(aspect): aspect}
+        return {}
+
+    aspects: Sequence[Optional[_Aspect]]
+    if isinstance(metadata, MetadataChangeEventClass):
+        aspects = metadata.proposedSnapshot.aspects
+    elif isinstance(metadata, MetadataChangeProposalWrapper):
+        aspects = [metadata.aspect]
+    elif isinstance(metadata, MetadataChangeProposalClass):
+        aspects = []
+        # Best effort attempt to deserialize MetadataChangeProposalClass
+        if any(metadata.aspectName == cls.ASPECT_NAME for cls in aspect_types):
+            try:
+                mcp = MetadataChangeProposalWrapper.try_from_mcpc(metadata)
+                if mcp:
+                    aspects = [mcp.aspect]
+            except Exception:
+                pass
+    else:
+        raise ValueError(f"Unexpected type {type(metadata)}")
+
+    found: Dict[Type[_Aspect], _Aspect] = {}
+    for aspect in aspects:
+        aspect_type = type(aspect)
+        if aspect_type in aspect_types:
+            found[aspect_type] = cast(_Aspect, aspect)
+    return found
+
+
 def _batch_workunits_by_urn(
     stream: Iterable[MetadataWorkUnit],
 ) -> Iterable[Tuple[str, List[MetadataWorkUnit]]]:
     batch: List[MetadataWorkUnit] = []
     batch_urn: Optional[str] = None
     for wu in stream:
-        if wu.get_urn() != batch_urn:
+        urn = wu.get_urn()
+        if urn != batch_urn:
             if batch_urn is not None:
                 yield batch_urn, batch
             batch = []
 
         batch.append(wu)
-        batch_urn = wu.get_urn()
+        batch_urn = urn
 
     if batch_urn is not None:
         yield batch_urn, batch
 
 
+def _get_container_path(
+    urn: str,
+    parent_containers: Dict[str, str],
+    container_entries: Dict[str, BrowsePathEntryClass],
+) -> List[BrowsePathEntryClass]:
+    """Build the container path of an urn, from root to immediate parent.
+
+    Only parent pointers are stored, rather than a full path per urn, so memory
+    stays linear in the number of containers. Urns without a known parent are
+    assumed to be roots.
+    """
+    ancestors: List[str] = []
+    seen: Set[str] = {urn}
+    parent = parent_containers.get(urn)
+    while parent is not None and parent not in seen:  # Guard against cycles
+        ancestors.append(parent)
+        seen.add(parent)
+        parent = parent_containers.get(parent)
+
+    path: List[BrowsePathEntryClass] = []
+    for ancestor in reversed(ancestors):
+        entry = container_entries.get(ancestor)
+        if entry is None:
+            entry = container_entries[ancestor] = BrowsePathEntryClass(
+                id=ancestor, urn=ancestor
+            )
+        path.append(entry)
+    return path
+
+
 def _prepend_platform_instance(
     entries: List[BrowsePathEntryClass],
     platform: Optional[str],
@@ -1,5 +1,5 @@
 import logging
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Iterable, Optional, Type, TypeVar, Union, overload
 
 from deprecated import deprecated
@@ -29,6 +29,9 @@ class MetadataWorkUnit(WorkUnit):
     # like auto_status_aspect and auto_stale_entity_removal.
     is_primary_source: bool = True
 
+    # Lazily populated by get_urn(), which is called by every workunit processor.
+    _urn: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+
     @overload
     def __init__(
         self, id: str, mce: MetadataChangeEvent, *, is_primary_source: bool = True
@@ -71,6 +74,7 @@ class MetadataWorkUnit(WorkUnit):
         super().__init__(id)
         self.treat_errors_as_warnings = treat_errors_as_warnings
         self.is_primary_source = is_primary_source
+        self._urn = None
 
         if sum(1 if v else 0 for v in [mce, mcp, mcp_raw]) != 1:
             raise ValueError("exactly one of mce, mcp, or mcp_raw must be provided")
@@ -87,11 +91,13 @@ class MetadataWorkUnit(WorkUnit):
         return {"metadata": self.metadata}
 
     def get_urn(self) -> str:
-        if isinstance(self.metadata, MetadataChangeEvent):
-            return self.metadata.proposedSnapshot.urn
-        else:
-            assert self.metadata.entityUrn
-            return self.metadata.entityUrn
+        if self._urn is None:
+            if isinstance(self.metadata, MetadataChangeEvent):
+                self._urn = self.metadata.proposedSnapshot.urn
+            else:
+                assert self.metadata.entityUrn
+                self._urn = self.metadata.entityUrn
+        return self._urn
 
     def get_aspect_of_type(self, aspect_cls: Type[T_Aspect]) -> Optional[T_Aspect]:
         aspects: list
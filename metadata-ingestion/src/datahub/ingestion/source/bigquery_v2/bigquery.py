@@ -1,11 +1,15 @@
 import atexit
+import concurrent.futures
+import functools
 import logging
 import os
+import queue
 import re
+import threading
 import traceback
-from collections import defaultdict
+from collections import defaultdict, deque
 from datetime import datetime, timedelta, timezone
-from typing import Dict, Iterable, List, Optional, Set, Tuple, Type, Union, cast
+from typing import Deque, Dict, Iterable, List, Optional, Tuple, Type, Union
 
 from google.cloud import bigquery
 from google.cloud.bigquery.table import TableListItem
@@ -53,6 +57,7 @@ from datahub.ingestion.source.bigquery_v2.bigquery_schema import (
 from datahub.ingestion.source.bigquery_v2.common import (
     BQ_EXTERNAL_DATASET_URL_TEMPLATE,
     BQ_EXTERNAL_TABLE_URL_TEMPLATE,
+    ThreadSafeSet,
     get_bigquery_client,
 )
 from datahub.ingestion.source.bigquery_v2.lineage import (
@@ -126,6 +131,44 @@ logger: logging.Logger = logging.getLogger(__name__)
 # Handle table snapshots
 # See https://cloud.google.com/bigquery/docs/table-snapshots-intro.
 SNAPSHOT_TABLE_REGEX = re.compile(r"^(.+)@(\d{13})$")
+COMPLEX_TYPE_PREFIXES = ("struct", "array")
+# Matches the [version=2.0].[type=struct]. tags of a field path
+FIELD_PATH_TAG_REGEX = re.compile(r"\[.*?\]\.", re.MULTILINE)
+# Column types the profiler cannot handle
+PROFILE_IGNORE_TYPE_REGEX = re.compile(r"array|struct|geography|json", re.IGNORECASE)
+
+# Fewer, larger pages make listing datasets with many tables noticeably faster
+BQ_LIST_TABLES_PAGE_SIZE = 1000
+# Upper bound on workunits buffered when datasets are processed in parallel
+BQ_MAX_BUFFERED_WORKUNITS = 1000
+
+PARTITION_KEY_TAG_URN = make_tag_urn(Constants.TAG_PARTITION_KEY)
+
+
+def _sanitized_table_ref(table_identifier: BigqueryTableIdentifier) -> str:
+    # Views and their upstreams resolve the same tables over and over. How a table
+    # is sanitized depends on the sharded table settings each source sets on
+    # BigqueryTableIdentifier, so those are part of the cache key.
+    return _cached_sanitized_table_ref(
+        table_identifier,
+        BigqueryTableIdentifier._BIGQUERY_DEFAULT_SHARDED_TABLE_REGEX,
+        BigqueryTableIdentifier._BQ_SHARDED_TABLE_SUFFIX,
+    )
+
+
+@functools.lru_cache(maxsize=65536)
+def _cached_sanitized_table_ref(
+    table_identifier: BigqueryTableIdentifier,
+    sharded_table_regex: str,
+    sharded_table_suffix: str,
+) -> str:
+    return str(BigQueryTableRef(table_identifier).get_sanitized_table_ref())
+
+
+@functools.lru_cache(maxsize=4096)
+def _label_tag_urn(key: str, value: str) -> str:
+    # The same labels tend to be set on many tables
+    return make_tag_urn(f"{key}:{value}")
 
 
 # We can't use close as it is not called if the ingestion is not successful
@@ -226,6 +269,8 @@ class BigqueryV2Source(StatefulIngestionSourceBase, TestableSource):
                 cached_domains=[k for k in self.config.domain], graph=self.ctx.graph
             )
 
+        self._start_time_millis = datetime_to_ts_millis(self.config.start_time)
+        self._end_time_millis = datetime_to_ts_millis(self.config.end_time)
         self.redundant_run_skip_handler = RedundantRunSkipHandler(
             source=self,
             config=self.config,
@@ -246,9 +291,14 @@ class BigqueryV2Source(StatefulIngestionSourceBase, TestableSource):
         )
 
         # Global store of table identifiers for lineage filtering
-        self.table_refs: Set[str] = set()
+        self.table_refs: ThreadSafeSet[str] = ThreadSafeSet()
         # Maps project -> view_ref -> [upstream_table_ref], for view lineage
         self.view_upstream_tables: Dict[str, Dict[str, List[str]]] = defaultdict(dict)
+        self._view_upstream_tables_lock = threading.Lock()
+
+        # Container keys by project and (project, dataset)
+        self._project_id_keys: Dict[str, PlatformKey] = {}
+        self._dataset_keys: Dict[Tuple[str, str], PlatformKey] = {}
 
         atexit.register(cleanup, config)
 
@@ -271,11 +321,11 @@ class BigqueryV2Source(StatefulIngestionSourceBase, TestableSource):
     def metada_read_capability_test(
         project_ids: List[str], config: BigQueryV2Config
     ) -> CapabilityReport:
-        for project_id in project_ids:
-            try:
+        try:
+            client: bigquery.Client = get_bigquery_client(config)
+            assert client
+            for project_id in project_ids:
                 logger.info((f"Metadata read capability test for project {project_id}"))
-                client: bigquery.Client = get_bigquery_client(config)
-                assert client
                 result = BigQueryDataDictionary.get_datasets_for_project_id(
                     client, project_id, 10
                 )
@@ -291,17 +341,16 @@ class BigqueryV2Source(StatefulIngestionSourceBase, TestableSource):
                     tables={},
                     with_data_read_permission=config.profiling.enabled,
                 )
-                if len(list(tables)) == 0:
+                if next(iter(tables), None) is None:
                     return CapabilityReport(
                         capable=False,
                         failure_reason=f"Tables query did not return any table. It is either empty or no tables in project {project_id}.{result[0].name}",
                     )
-
-            except Exception as e:
-                return CapabilityReport(
-                    capable=False,
-                    failure_reason=f"Dataset query failed with error: {e}",
-                )
+        except Exception as e:
+            return CapabilityReport(
+                capable=False,
+                failure_reason=f"Dataset query failed with error: {e}",
+            )
 
         return CapabilityReport(capable=True)
 
@@ -363,7 +412,6 @@ class BigqueryV2Source(StatefulIngestionSourceBase, TestableSource):
             connection_conf.start_time = datetime.now()
             connection_conf.end_time = datetime.now() + timedelta(minutes=1)
 
-            report: BigQueryV2Report = BigQueryV2Report()
             project_ids: List[str] = []
             projects = client.list_projects()
 
@@ -371,25 +419,42 @@ class BigqueryV2Source(StatefulIngestionSourceBase, TestableSource):
                 if connection_conf.project_id_pattern.allowed(project.project_id):
                     project_ids.append(project.project_id)
 
-            metada_read_capability = BigqueryV2Source.metada_read_capability_test(
-                project_ids, connection_conf
-            )
-            if SourceCapability.SCHEMA_METADATA not in _report:
-                _report[SourceCapability.SCHEMA_METADATA] = metada_read_capability
+            # The capability tests are independent of each other, so they are run
+            # concurrently. Each one gets its own report, as the usage test checks
+            # its report for new failures.
+            with concurrent.futures.ThreadPoolExecutor(max_workers=3) as async_executor:
+                capability_futures: Dict[
+                    SourceCapability, concurrent.futures.Future
+                ] = {
+                    SourceCapability.SCHEMA_METADATA: async_executor.submit(
+                        BigqueryV2Source.metada_read_capability_test,
+                        project_ids,
+                        connection_conf,
+                    )
+                }
 
-            if connection_conf.include_table_lineage:
-                lineage_capability = BigqueryV2Source.lineage_capability_test(
-                    connection_conf, project_ids, report
-                )
-                if SourceCapability.LINEAGE_COARSE not in _report:
-                    _report[SourceCapability.LINEAGE_COARSE] = lineage_capability
+                if connection_conf.include_table_lineage:
+                    capability_futures[
+                        SourceCapability.LINEAGE_COARSE
+                    ] = async_executor.submit(
+                        BigqueryV2Source.lineage_capability_test,
+                        connection_conf,
+                        project_ids,
+                        BigQueryV2Report(),
+                    )
 
-            if connection_conf.include_usage_statistics:
-                usage_capability = BigqueryV2Source.usage_capability_test(
-                    connection_conf, project_ids, report
-                )
-                if SourceCapability.USAGE_STATS not in _report:
-                    _report[SourceCapability.USAGE_STATS] = usage_capability
+                if connection_conf.include_usage_statistics:
+                    capability_futures[
+                        SourceCapability.USAGE_STATS
+                    ] = async_executor.submit(
+                        BigqueryV2Source.usage_capability_test,
+                        connection_conf,
+                        project_ids,
+                        BigQueryV2Report(),
+                    )
+
+                for source_capability, future in capability_futures.items():
+                    _report[source_capability] = future.result()
 
             test_report.capability_report = _report
             return test_report
@@ -412,21 +477,31 @@ class BigqueryV2Source(StatefulIngestionSourceBase, TestableSource):
         ).as_workunit()
 
     def gen_dataset_key(self, db_name: str, schema: str) -> PlatformKey:
-        return BigQueryDatasetKey(
-            project_id=db_name,
-            dataset_id=schema,
-            platform=self.platform,
-            env=self.config.env,
-            backcompat_env_as_instance=True,
-        )
+        # The key is needed for every table of a dataset, so it is only built (and
+        # validated) once per dataset
+        key = self._dataset_keys.get((db_name, schema))
+        if key is None:
+            key = BigQueryDatasetKey(
+                project_id=db_name,
+                dataset_id=schema,
+                platform=self.platform,
+                env=self.config.env,
+                backcompat_env_as_instance=True,
+            )
+            self._dataset_keys[(db_name, schema)] = key
+        return key
 
     def gen_project_id_key(self, database: str) -> PlatformKey:
-        return ProjectIdKey(
-            project_id=database,
-            platform=self.platform,
-            env=self.config.env,
-            backcompat_env_as_instance=True,
-        )
+        key = self._project_id_keys.get(database)
+        if key is None:
+            key = ProjectIdKey(
+                project_id=database,
+                platform=self.platform,
+                env=self.config.env,
+                backcompat_env_as_instance=True,
+            )
+            self._project_id_keys[database] = key
+        return key
 
     def gen_project_id_containers(self, database: str) -> Iterable[MetadataWorkUnit]:
         database_container_key = self.gen_project_id_key(database)
@@ -491,55 +566,59 @@ class BigqueryV2Source(StatefulIngestionSourceBase, TestableSource):
             yield from self.usage_extractor.run(
                 [p.id for p in projects], self.table_refs
             )
+            if self.config.store_last_usage_extraction_timestamp:
+                self._update_redundant_run_skip_state()
 
         if self._should_ingest_lineage():
             for project in projects:
                 self.report.set_ingestion_stage(project.id, "Lineage Extraction")
                 yield from self.generate_lineage(project.id)
+            if self.config.store_last_lineage_extraction_timestamp:
+                self._update_redundant_run_skip_state()
 
     def _should_ingest_usage(self) -> bool:
         if not self.config.include_usage_statistics:
             return False
 
-        if self.config.store_last_usage_extraction_timestamp:
-            if self.redundant_run_skip_handler.should_skip_this_run(
-                cur_start_time_millis=datetime_to_ts_millis(self.config.start_time)
-            ):
-                self.report.report_warning(
-                    "usage-extraction",
-                    f"Skip this run as there was a run later than the current start time: {self.config.start_time}",
-                )
-                return False
-            else:
-                # Update the checkpoint state for this run.
-                self.redundant_run_skip_handler.update_state(
-                    start_time_millis=datetime_to_ts_millis(self.config.start_time),
-                    end_time_millis=datetime_to_ts_millis(self.config.end_time),
-                )
+        if (
+            self.config.store_last_usage_extraction_timestamp
+            and self.redundant_run_skip_handler.should_skip_this_run(
+                cur_start_time_millis=self._start_time_millis
+            )
+        ):
+            self.report.report_warning(
+                "usage-extraction",
+                f"Skip this run as there was a run later than the current start time: {self.config.start_time}",
+            )
+            return False
         return True
 
     def _should_ingest_lineage(self) -> bool:
         if not self.config.include_table_lineage:
             return False
 
-        if self.config.store_last_lineage_extraction_timestamp:
-            if self.redundant_run_skip_handler.should_skip_this_run(
-                cur_start_time_millis=datetime_to_ts_millis(self.config.start_time)
-            ):
-                # Skip this run
-                self.report.report_warning(
-                    "lineage-extraction",
-                    f"Skip this run as there was a run later than the current start time: {self.config.start_time}",
-                )
-                return False
-            else:
-                # Update the checkpoint state for this run.
-                self.redundant_run_skip_handler.update_state(
-                    start_time_millis=datetime_to_ts_millis(self.config.start_time),
-                    end_time_millis=datetime_to_ts_millis(self.config.end_time),
-                )
+        if (
+            self.config.store_last_lineage_extraction_timestamp
+            and self.redundant_run_skip_handler.should_skip_this_run(
+                cur_start_time_millis=self._start_time_millis
+            )
+        ):
+            # Skip this run
+            self.report.report_warning(
+                "lineage-extraction",
+                f"Skip this run as there was a run later than the current start time: {self.config.start_time}",
+            )
+            return False
         return True
 
+    def _update_redundant_run_skip_state(self) -> None:
+        # Only called once a stage has emitted all of its workunits, so that a run
+        # failing midway doesn't mark its time window as done
+        self.redundant_run_skip_handler.update_state(
+            start_time_millis=self._start_time_millis,
+            end_time_millis=self._end_time_millis,
+        )
+
     def _get_projects(self, conn: bigquery.Client) -> List[BigqueryProject]:
         logger.info("Getting projects")
         if self.config.project_ids or self.config.project_id:
@@ -583,9 +662,24 @@ class BigqueryV2Source(StatefulIngestionSourceBase, TestableSource):
 
         yield from self.gen_project_id_containers(project_id)
 
+        def _is_dataset_allowed(dataset_name: str) -> bool:
+            if not is_schema_allowed(
+                self.config.dataset_pattern,
+                dataset_name,
+                project_id,
+                self.config.match_fully_qualified_names,
+            ):
+                self.report.report_dropped(f"{dataset_name}.*")
+                return False
+            return True
+
         try:
+            # Disallowed datasets are filtered out before any further metadata is
+            # fetched for them
             bigquery_project.datasets = (
-                BigQueryDataDictionary.get_datasets_for_project_id(conn, project_id)
+                BigQueryDataDictionary.get_datasets_for_project_id(
+                    conn, project_id, dataset_filter=_is_dataset_allowed
+                )
             )
         except Exception as e:
             error_message = f"Unable to get datasets for project {project_id}, skipping. The error was: {e}"
@@ -607,35 +701,16 @@ class BigqueryV2Source(StatefulIngestionSourceBase, TestableSource):
         self.report.num_project_datasets_to_scan[project_id] = len(
             bigquery_project.datasets
         )
-        for bigquery_dataset in bigquery_project.datasets:
-            if not is_schema_allowed(
-                self.config.dataset_pattern,
-                bigquery_dataset.name,
-                project_id,
-                self.config.match_fully_qualified_names,
-            ):
-                self.report.report_dropped(f"{bigquery_dataset.name}.*")
-                continue
-            try:
-                # db_tables and db_views are populated in the this method
-                yield from self._process_schema(
+        if self.config.max_threads_dataset_parallelism > 1:
+            yield from self._process_datasets_in_parallel(
+                conn, project_id, bigquery_project.datasets, db_tables, db_views
+            )
+        else:
+            for bigquery_dataset in bigquery_project.datasets:
+                yield from self._process_dataset(
                     conn, project_id, bigquery_dataset, db_tables, db_views
                 )
 
-            except Exception as e:
-                error_message = f"Unable to get tables for dataset {bigquery_dataset.name} in project {project_id}, skipping. Does your service account has bigquery.tables.list, bigquery.routines.get, bigquery.routines.list permission? The error was: {e}"
-                if self.config.profiling.enabled:
-                    error_message = f"Unable to get tables for dataset {bigquery_dataset.name} in project {project_id}, skipping. Does your service account has bigquery.tables.list, bigquery.routines.get, bigquery.routines.list permission, bigquery.tables.getData permission? The error was: {e}"
-
-                trace = traceback.format_exc()
-                logger.error(trace)
-                logger.error(error_message)
-                self.report.report_failure(
-                    "metadata-extraction",
-                    f"{project_id}.{bigquery_dataset.name} - {error_message} - {trace}",
-                )
-                continue
-
         if self.config.profiling.enabled:
             logger.info(f"Starting profiling project {project_id}")
             self.report.set_ingestion_stage(project_id, "Profiling")
@@ -644,17 +719,122 @@ class BigqueryV2Source(StatefulIngestionSourceBase, TestableSource):
                 tables=db_tables,
             )
 
+    def _process_datasets_in_parallel(
+        self,
+        conn: bigquery.Client,
+        project_id: str,
+        datasets: List[BigqueryDataset],
+        db_tables: Dict[str, List[BigqueryTable]],
+        db_views: Dict[str, List[BigqueryView]],
+    ) -> Iterable[MetadataWorkUnit]:
+        max_workers = self.config.max_threads_dataset_parallelism
+        # Each dataset streams its workunits through its own bounded queue, so that
+        # at most BQ_MAX_BUFFERED_WORKUNITS workunits are held in memory at once
+        queue_size = max(1, BQ_MAX_BUFFERED_WORKUNITS // max_workers)
+        stop = threading.Event()
+
+        def _put(
+            out: "queue.Queue[Optional[MetadataWorkUnit]]",
+            item: Optional[MetadataWorkUnit],
+        ) -> bool:
+            # Gives up once the consumer has stopped reading, so workers never hang
+            while not stop.is_set():
+                try:
+                    out.put(item, timeout=1)
+                    return True
+                except queue.Full:
+                    pass
+            return False
+
+        def _produce(
+            bigquery_dataset: BigqueryDataset,
+            out: "queue.Queue[Optional[MetadataWorkUnit]]",
+        ) -> None:
+            try:
+                for wu in self._process_dataset(
+                    conn, project_id, bigquery_dataset, db_tables, db_views
+                ):
+                    if not _put(out, wu):
+                        return
+            finally:
+                # None marks the end of the dataset's workunits
+                _put(out, None)
+
+        datasets_iter = iter(datasets)
+        pending: Deque[
+            Tuple[concurrent.futures.Future, "queue.Queue[Optional[MetadataWorkUnit]]"]
+        ] = deque()
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_workers
+        ) as async_executor:
+            try:
+                while True:
+                    # Only as many datasets as there are workers are started, so
+                    # every started dataset is running and the oldest one can't stall
+                    for bigquery_dataset in datasets_iter:
+                        out: "queue.Queue[Optional[MetadataWorkUnit]]" = queue.Queue(
+                            maxsize=queue_size
+                        )
+                        pending.append(
+                            (
+                                async_executor.submit(_produce, bigquery_dataset, out),
+                                out,
+                            )
+                        )
+                        if len(pending) >= max_workers:
+                            break
+
+                    if not pending:
+                        break
+
+                    # Datasets are drained in the order they were submitted, which
+                    # keeps the output order stable and each dataset's workunits
+                    # together
+                    future, out = pending.popleft()
+                    yield from iter(out.get, None)
+                    future.result()
+            finally:
+                stop.set()
+
+    def _process_dataset(
+        self,
+        conn: bigquery.Client,
+        project_id: str,
+        bigquery_dataset: BigqueryDataset,
+        db_tables: Dict[str, List[BigqueryTable]],
+        db_views: Dict[str, List[BigqueryView]],
+    ) -> Iterable[MetadataWorkUnit]:
+        try:
+            # db_tables and db_views are populated in the this method
+            yield from self._process_schema(
+                conn, project_id, bigquery_dataset, db_tables, db_views
+            )
+
+        except Exception as e:
+            error_message = f"Unable to get tables for dataset {bigquery_dataset.name} in project {project_id}, skipping. Does your service account has bigquery.tables.list, bigquery.routines.get, bigquery.routines.list permission? The error was: {e}"
+            if self.config.profiling.enabled:
+                error_message = f"Unable to get tables for dataset {bigquery_dataset.name} in project {project_id}, skipping. Does your service account has bigquery.tables.list, bigquery.routines.get, bigquery.routines.list permission, bigquery.tables.getData permission? The error was: {e}"
+
+            trace = traceback.format_exc()
+            logger.error(trace)
+            logger.error(error_message)
+            self.report.report_failure(
+                "metadata-extraction",
+                f"{project_id}.{bigquery_dataset.name} - {error_message} - {trace}",
+            )
+
     def generate_lineage(self, project_id: str) -> Iterable[MetadataWorkUnit]:
         logger.info(f"Generate lineage for {project_id}")
         lineage = self.lineage_extractor.calculate_lineage_for_project(project_id)
 
         if self.config.lineage_parse_view_ddl:
+            audit_stamp = datetime.now(timezone.utc)
             for view, upstream_tables in self.view_upstream_tables[project_id].items():
                 # Override upstreams obtained by parsing audit logs as they may contain indirectly referenced tables
                 lineage[view] = {
                     LineageEdge(
                         table=table,
-                        auditStamp=datetime.now(timezone.utc),
+                        auditStamp=audit_stamp,
                         type=DatasetLineageTypeClass.VIEW,
                     )
                     for table in upstream_tables
@@ -705,11 +885,10 @@ class BigqueryV2Source(StatefulIngestionSourceBase, TestableSource):
             )
 
         if self.config.include_tables:
-            db_tables[dataset_name] = list(
-                self.get_tables_for_dataset(conn, project_id, dataset_name)
-            )
-
-            for table in db_tables[dataset_name]:
+            # Tables are processed as they are fetched and only kept around if the
+            # profiler needs them later on
+            dataset_tables: List[BigqueryTable] = []
+            for table in self.get_tables_for_dataset(conn, project_id, dataset_name):
                 table_columns = columns.get(table.name, []) if columns else []
                 yield from self._process_table(
                     table=table,
@@ -717,25 +896,42 @@ class BigqueryV2Source(StatefulIngestionSourceBase, TestableSource):
                     project_id=project_id,
                     dataset_name=dataset_name,
                 )
+                if self.config.profiling.enabled:
+                    dataset_tables.append(table)
+            db_tables[dataset_name] = dataset_tables
         elif self.config.include_table_lineage or self.config.include_usage_statistics:
             # Need table_refs to calculate lineage and usage
-            for table_item in conn.list_tables(f"{project_id}.{dataset_name}"):
+            dataset_table_refs: List[str] = []
+            dropped_tables: List[str] = []
+            # Sanitizing a ref only changes its table part, so the rest of it is built
+            # once per dataset. Project ids with a domain prefix contain dots, which
+            # get_sanitized_table_ref splits on, so they take the regular path.
+            table_ref_prefix: Optional[str] = (
+                f"projects/{project_id}/datasets/{dataset_name}/tables/"
+                if "." not in project_id
+                else None
+            )
+            for table_item in self._list_tables(conn, project_id, dataset_name):
                 identifier = BigqueryTableIdentifier(
                     project_id=project_id,
                     dataset=dataset_name,
                     table=table_item.table_id,
                 )
                 if not self.config.table_pattern.allowed(identifier.raw_table_name()):
-                    self.report.report_dropped(identifier.raw_table_name())
+                    dropped_tables.append(identifier.raw_table_name())
                     continue
                 try:
-                    self.table_refs.add(
-                        str(BigQueryTableRef(identifier).get_sanitized_table_ref())
+                    dataset_table_refs.append(
+                        table_ref_prefix + identifier.get_sanitized_table_name()
+                        if table_ref_prefix is not None
+                        else _sanitized_table_ref(identifier)
                     )
                 except Exception as e:
                     logger.warning(
                         f"Could not create table ref for {table_item.path}: {e}"
                     )
+            self.table_refs.add_many(dataset_table_refs)
+            self.report.report_dropped_bulk(dropped_tables)
 
         if self.config.include_views:
             db_views[dataset_name] = list(
@@ -756,14 +952,12 @@ class BigqueryV2Source(StatefulIngestionSourceBase, TestableSource):
     # This method is used to generate the ignore list for datatypes the profiler doesn't support we have to do it here
     # because the profiler doesn't have access to columns
     def generate_profile_ignore_list(self, columns: List[BigqueryColumn]) -> List[str]:
-        ignore_list: List[str] = []
-        for column in columns:
-            if not column.data_type or any(
-                word in column.data_type.lower()
-                for word in ["array", "struct", "geography", "json"]
-            ):
-                ignore_list.append(column.field_path)
-        return ignore_list
+        return [
+            column.field_path
+            for column in columns
+            if not column.data_type
+            or PROFILE_IGNORE_TYPE_REGEX.search(column.data_type)
+        ]
 
     def _process_table(
         self,
@@ -781,9 +975,7 @@ class BigqueryV2Source(StatefulIngestionSourceBase, TestableSource):
             return
 
         if self.config.include_table_lineage or self.config.include_usage_statistics:
-            self.table_refs.add(
-                str(BigQueryTableRef(table_identifier).get_sanitized_table_ref())
-            )
+            self.table_refs.add(_sanitized_table_ref(table_identifier))
         table.column_count = len(columns)
 
         # We only collect profile ignore list if profiling is enabled and profile_table_level_only is false
@@ -830,19 +1022,20 @@ class BigqueryV2Source(StatefulIngestionSourceBase, TestableSource):
             return
 
         if self.config.include_table_lineage or self.config.include_usage_statistics:
-            table_ref = str(
-                BigQueryTableRef(table_identifier).get_sanitized_table_ref()
-            )
+            table_ref = _sanitized_table_ref(table_identifier)
             self.table_refs.add(table_ref)
             if self.config.lineage_parse_view_ddl:
                 upstream_tables = self.lineage_extractor.parse_view_lineage(
                     project_id, dataset_name, view
                 )
                 if upstream_tables is not None:
-                    self.view_upstream_tables[project_id][table_ref] = [
-                        str(BigQueryTableRef(table_id).get_sanitized_table_ref())
-                        for table_id in upstream_tables
+                    upstream_table_refs = [
+                        _sanitized_table_ref(table_id) for table_id in upstream_tables
                     ]
+                    with self._view_upstream_tables_lock:
+                        self.view_upstream_tables[project_id][
+                            table_ref
+                        ] = upstream_table_refs
 
         view.column_count = len(columns)
         if not view.column_count:
@@ -897,10 +1090,7 @@ class BigqueryV2Source(StatefulIngestionSourceBase, TestableSource):
 
         tags_to_add = None
         if table.labels and self.config.capture_table_label_as_tag:
-            tags_to_add = []
-            tags_to_add.extend(
-                [make_tag_urn(f"""{k}:{v}""") for k, v in table.labels.items()]
-            )
+            tags_to_add = [_label_tag_urn(k, v) for k, v in table.labels.items()]
 
         yield from self.gen_dataset_workunits(
             table=table,
@@ -927,12 +1117,10 @@ class BigqueryV2Source(StatefulIngestionSourceBase, TestableSource):
             sub_types=[DatasetSubTypes.VIEW],
         )
 
-        view = cast(BigqueryView, table)
-        view_definition_string = view.view_definition
         view_properties_aspect = ViewProperties(
-            materialized=view.materialized,
+            materialized=table.materialized,
             viewLanguage="SQL",
-            viewLogic=view_definition_string,
+            viewLogic=table.view_definition,
         )
         yield MetadataChangeProposalWrapper(
             entityUrn=self.gen_dataset_urn(
@@ -951,27 +1139,24 @@ class BigqueryV2Source(StatefulIngestionSourceBase, TestableSource):
         tags_to_add: Optional[List[str]] = None,
         custom_properties: Optional[Dict[str, str]] = None,
     ) -> Iterable[MetadataWorkUnit]:
-        dataset_urn = self.gen_dataset_urn(
-            project_id=project_id, dataset_name=dataset_name, table=table.name
+        datahub_dataset_name = BigqueryTableIdentifier(
+            project_id, dataset_name, table.name
         )
+        # Sanitizing the table name runs several regexes, so do it only once
+        qualified_name = str(datahub_dataset_name)
+        dataset_urn = self.gen_dataset_urn_from_qualified_name(qualified_name)
 
         status = Status(removed=False)
         yield MetadataChangeProposalWrapper(
             entityUrn=dataset_urn, aspect=status
         ).as_workunit()
 
-        datahub_dataset_name = BigqueryTableIdentifier(
-            project_id, dataset_name, table.name
-        )
-
-        yield self.gen_schema_metadata(
-            dataset_urn, table, columns, str(datahub_dataset_name)
-        )
+        yield self.gen_schema_metadata(dataset_urn, table, columns, qualified_name)
 
         dataset_properties = DatasetProperties(
             name=datahub_dataset_name.get_table_display_name(),
             description=table.comment,
-            qualifiedName=str(datahub_dataset_name),
+            qualifiedName=qualified_name,
             created=TimeStamp(time=int(table.created.timestamp() * 1000))
             if table.created is not None
             else None,
@@ -985,9 +1170,8 @@ class BigqueryV2Source(StatefulIngestionSourceBase, TestableSource):
             )
             if self.config.include_external_url
             else None,
+            customProperties=custom_properties,
         )
-        if custom_properties:
-            dataset_properties.customProperties.update(custom_properties)
 
         yield MetadataChangeProposalWrapper(
             entityUrn=dataset_urn, aspect=dataset_properties
@@ -1011,7 +1195,7 @@ class BigqueryV2Source(StatefulIngestionSourceBase, TestableSource):
 
         if self.domain_registry:
             yield from get_domain_wu(
-                dataset_name=str(datahub_dataset_name),
+                dataset_name=qualified_name,
                 entity_urn=dataset_urn,
                 domain_registry=self.domain_registry,
                 domain_config=self.config.domain,
@@ -1034,19 +1218,15 @@ class BigqueryV2Source(StatefulIngestionSourceBase, TestableSource):
                 for upstream in upstream_lineage.upstreams:
                     patch_builder.add_upstream_lineage(upstream)
 
-                yield from [
-                    MetadataWorkUnit(
+                for mcp in patch_builder.build():
+                    yield MetadataWorkUnit(
                         id=f"upstreamLineage-for-{dataset_urn}",
                         mcp_raw=mcp,
                     )
-                    for mcp in patch_builder.build()
-                ]
             else:
-                yield from [
-                    MetadataChangeProposalWrapper(
-                        entityUrn=dataset_urn, aspect=upstream_lineage
-                    ).as_workunit()
-                ]
+                yield MetadataChangeProposalWrapper(
+                    entityUrn=dataset_urn, aspect=upstream_lineage
+                ).as_workunit()
 
     def gen_tags_aspect_workunit(
         self, dataset_urn: str, tags_to_add: List[str]
@@ -1060,61 +1240,64 @@ class BigqueryV2Source(StatefulIngestionSourceBase, TestableSource):
 
     def gen_dataset_urn(self, project_id: str, dataset_name: str, table: str) -> str:
         datahub_dataset_name = BigqueryTableIdentifier(project_id, dataset_name, table)
-        dataset_urn = make_dataset_urn(
-            self.platform,
-            str(datahub_dataset_name),
-            self.config.env,
-        )
-        return dataset_urn
+        return self.gen_dataset_urn_from_qualified_name(str(datahub_dataset_name))
+
+    def gen_dataset_urn_from_qualified_name(self, qualified_name: str) -> str:
+        # Takes the str() of a BigqueryTableIdentifier, for callers that need the
+        # sanitized name as well and shouldn't compute it twice
+        return make_dataset_urn(self.platform, qualified_name, self.config.env)
 
     def gen_schema_fields(self, columns: List[BigqueryColumn]) -> List[SchemaField]:
         schema_fields: List[SchemaField] = []
+        # Fields by their path without the [version=2.0].[type=struct]. tags, used to
+        # add complex type comments to the correct level
+        fields_by_path: Dict[str, List[SchemaField]] = defaultdict(list)
 
         HiveColumnToAvroConverter._STRUCT_TYPE_SEPARATOR = " "
-        _COMPLEX_TYPE = re.compile("^(struct|array)")
+        # Looked up once per column, so bind it outside the loop
+        field_type_mappings = self.BIGQUERY_FIELD_TYPE_MAPPINGS
         last_id = -1
         for col in columns:
+            data_type = (
+                col.data_type.lower() if col.data_type is not None else col.data_type
+            )
             # if col.data_type is empty that means this column is part of a complex type
-            if col.data_type is None or _COMPLEX_TYPE.match(col.data_type.lower()):
+            if data_type is None or data_type.startswith(COMPLEX_TYPE_PREFIXES):
                 # If the we have seen the ordinal position that most probably means we already processed this complex type
                 if last_id != col.ordinal_position:
-                    schema_fields.extend(
-                        get_schema_fields_for_hive_column(
-                            col.name, col.data_type.lower(), description=col.comment
-                        )
-                    )
+                    for field in get_schema_fields_for_hive_column(
+                        col.name, data_type, description=col.comment
+                    ):
+                        schema_fields.append(field)
+                        fields_by_path[
+                            FIELD_PATH_TAG_REGEX.sub("", field.fieldPath)
+                        ].append(field)
 
                 # We have to add complex type comments to the correct level
                 if col.comment:
-                    for idx, field in enumerate(schema_fields):
-                        # Remove all the [version=2.0].[type=struct]. tags to get the field path
-                        if (
-                            re.sub(r"\[.*?\]\.", "", field.fieldPath, 0, re.MULTILINE)
-                            == col.field_path
-                        ):
-                            field.description = col.comment
-                            schema_fields[idx] = field
+                    for field in fields_by_path.get(col.field_path, []):
+                        field.description = col.comment
             else:
                 field = SchemaField(
                     fieldPath=col.name,
                     type=SchemaFieldDataType(
-                        self.BIGQUERY_FIELD_TYPE_MAPPINGS.get(col.data_type, NullType)()
+                        field_type_mappings.get(col.data_type, NullType)()
                     ),
                     # NOTE: nativeDataType will not be in sync with older connector
                     nativeDataType=col.data_type,
                     description=col.comment,
                     nullable=col.is_nullable,
+                    # Tags are built per field, transformers may modify them in place
                     globalTags=GlobalTagsClass(
-                        tags=[
-                            TagAssociationClass(
-                                make_tag_urn(Constants.TAG_PARTITION_KEY)
-                            )
-                        ]
+                        tags=[TagAssociationClass(PARTITION_KEY_TAG_URN)]
                     )
                     if col.is_partition_column
                     else GlobalTagsClass(tags=[]),
                 )
                 schema_fields.append(field)
+                fields_by_path[FIELD_PATH_TAG_REGEX.sub("", field.fieldPath)].append(
+                    field
+                )
             last_id = col.ordinal_position
         return schema_fields
 
@@ -1164,10 +1347,25 @@ class BigqueryV2Source(StatefulIngestionSourceBase, TestableSource):
             # We collect only the latest shards from sharded tables (tables with _YYYYMMDD suffix) and ignore temporary tables
             table_items = self.get_core_table_details(conn, dataset_name, project_id)
 
-            items_to_get: Dict[str, TableListItem] = {}
-            for table_item in table_items.keys():
-                items_to_get[table_item] = table_items[table_item]
-                if len(items_to_get) % max_batch_size == 0:
+            if self.config.number_of_parallel_metadata_fetch > 1:
+                yield from self._get_table_batches_in_parallel(
+                    conn, project_id, dataset_name, table_items, max_batch_size
+                )
+            else:
+                items_to_get: Dict[str, TableListItem] = {}
+                for table_item in table_items.keys():
+                    items_to_get[table_item] = table_items[table_item]
+                    if len(items_to_get) % max_batch_size == 0:
+                        yield from BigQueryDataDictionary.get_tables_for_dataset(
+                            conn,
+                            project_id,
+                            dataset_name,
+                            items_to_get,
+                            with_data_read_permission=self.config.profiling.enabled,
+                        )
+                        items_to_get.clear()
+
+                if items_to_get:
                     yield from BigQueryDataDictionary.get_tables_for_dataset(
                         conn,
                         project_id,
@@ -1175,19 +1373,49 @@ class BigqueryV2Source(StatefulIngestionSourceBase, TestableSource):
                         items_to_get,
                         with_data_read_permission=self.config.profiling.enabled,
                     )
-                    items_to_get.clear()
 
-            if items_to_get:
-                yield from BigQueryDataDictionary.get_tables_for_dataset(
+        self.report.metadata_extraction_sec[f"{project_id}.{dataset_name}"] = round(
+            timer.elapsed_seconds(), 2
+        )
+
+    def _get_table_batches_in_parallel(
+        self,
+        conn: bigquery.Client,
+        project_id: str,
+        dataset_name: str,
+        table_items: Dict[str, TableListItem],
+        max_batch_size: int,
+    ) -> Iterable[BigqueryTable]:
+        table_names = list(table_items.keys())
+        batches: List[Dict[str, TableListItem]] = [
+            {name: table_items[name] for name in table_names[i : i + max_batch_size]}
+            for i in range(0, len(table_names), max_batch_size)
+        ]
+
+        def _get_tables(batch: Dict[str, TableListItem]) -> List[BigqueryTable]:
+            return list(
+                BigQueryDataDictionary.get_tables_for_dataset(
                     conn,
                     project_id,
                     dataset_name,
-                    items_to_get,
+                    batch,
                     with_data_read_permission=self.config.profiling.enabled,
                 )
+            )
 
-        self.report.metadata_extraction_sec[f"{project_id}.{dataset_name}"] = round(
-            timer.elapsed_seconds(), 2
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.config.number_of_parallel_metadata_fetch
+        ) as async_executor:
+            # Results are yielded in batch order so the output stays deterministic
+            for tables in async_executor.map(_get_tables, batches):
+                yield from tables
+
+    @staticmethod
+    def _list_tables(
+        conn: bigquery.Client, project_id: str, dataset_name: str
+    ) -> Iterable[TableListItem]:
+        return conn.list_tables(
+            f"{project_id}.{dataset_name}", page_size=BQ_LIST_TABLES_PAGE_SIZE
         )
 
     def get_core_table_details(
@@ -1195,19 +1423,17 @@ class BigqueryV2Source(StatefulIngestionSourceBase, TestableSource):
     ) -> Dict[str, TableListItem]:
         table_items: Dict[str, TableListItem] = {}
         # Dict to store sharded table and the last seen max shard id
-        sharded_tables: Dict[str, TableListItem] = {}
+        sharded_tables: Dict[str, Tuple[str, TableListItem]] = {}
+        dropped_tables: List[str] = []
 
-        for table in conn.list_tables(f"{project_id}.{dataset_name}"):
+        for table in self._list_tables(conn, project_id, dataset_name):
             table_identifier = BigqueryTableIdentifier(
                 project_id=project_id,
                 dataset=dataset_name,
                 table=table.table_id,
             )
 
-            _, shard = BigqueryTableIdentifier.get_table_and_shard(
-                table_identifier.table
-            )
-            table_name = table_identifier.get_table_name().split(".")[-1]
+            _, shard = BigqueryTableIdentifier.get_table_and_shard(table.table_id)
 
             # Sharded tables look like: table_20220120
             # For sharded tables we only process the latest shard and ignore the rest
@@ -1217,33 +1443,29 @@ class BigqueryV2Source(StatefulIngestionSourceBase, TestableSource):
             # For example some_dataset.20220110 will be turned to some_dataset.some_dataset
             # It seems like there are some bigquery user who uses this non-standard way of sharding the tables.
             if shard:
-                if table_name not in sharded_tables:
-                    sharded_tables[table_name] = table
-                    continue
-
-                stored_table_identifier = BigqueryTableIdentifier(
-                    project_id=project_id,
-                    dataset=dataset_name,
-                    table=sharded_tables[table_name].table_id,
-                )
-                _, stored_shard = BigqueryTableIdentifier.get_table_and_shard(
-                    stored_table_identifier.table
-                )
-                # When table is none, we use dataset_name as table_name
-                assert stored_shard
-                if stored_shard < shard:
-                    sharded_tables[table_name] = table
+                table_name = table_identifier.get_sanitized_table_name()
+                stored_shard_and_table = sharded_tables.get(table_name)
+                # The shard is stored along with the table, so it doesn't have to be
+                # parsed again for every other shard of the same table
+                if stored_shard_and_table is None or stored_shard_and_table[0] < shard:
+                    sharded_tables[table_name] = (shard, table)
                 continue
-            elif str(table_identifier).startswith(
+            elif table_identifier.get_table_name().startswith(
                 self.config.temp_table_dataset_prefix
             ):
                 logger.debug(f"Dropping temporary table {table_identifier.table}")
-                self.report.report_dropped(table_identifier.raw_table_name())
+                dropped_tables.append(table_identifier.raw_table_name())
                 continue
 
             table_items[table.table_id] = table
         # Adding maximum shards to the list of tables
-        table_items.update({value.table_id: value for value in sharded_tables.values()})
+        table_items.update(
+            {
+                shard_table.table_id: shard_table
+                for _, shard_table in sharded_tables.values()
+            }
+        )
+        self.report.report_dropped_bulk(dropped_tables)
 
         return table_items
 
@@ -145,9 +145,13 @@ class BigqueryTableIdentifier:
             - removes wildcard part (table_yyyy* -> table)
             - remove time decorator (table@1624046611000 -> table)
         """
-        table_name: str = (
-            f"{self.project_id}.{self.dataset}.{self.get_table_display_name()}"
-        )
+        return f"{self.project_id}.{self.dataset}.{self.get_sanitized_table_name()}"
+
+    def get_sanitized_table_name(self) -> str:
+        """
+        Returns the table part of the qualified table name, see get_table_name
+        """
+        table_name: str = self.get_table_display_name()
         if self.is_sharded_table():
             table_name += BigqueryTableIdentifier._BQ_SHARDED_TABLE_SUFFIX
         return table_name
@@ -96,6 +96,16 @@ class BigQueryV2Config(
         description="Number of partitioned table queried in batch when getting metadata. This is a low level config property which should be touched with care. This restriction is needed because we query partitions system view which throws error if we try to touch too many tables.",
     )
 
+    max_threads_dataset_parallelism: int = Field(
+        default=1,
+        description="Number of worker threads to use to parallelize BigQuery dataset metadata extraction within a project. Workunits are still emitted in dataset order, and at most 1000 of them are buffered at a time. Defaults to 1, which processes datasets one after another.",
+    )
+
+    number_of_parallel_metadata_fetch: int = Field(
+        default=1,
+        description="Number of table batches of a dataset to fetch metadata for in parallel. The batch size is set by number_of_datasets_process_in_batch. Set to 1 to fetch batches one after another.",
+    )
+
     column_limit: int = Field(
         default=300,
         description="Maximum number of columns to process in a table. This is a low level config property which should be touched with care. This restriction is needed because excessively wide tables can result in failure to ingest the schema.",
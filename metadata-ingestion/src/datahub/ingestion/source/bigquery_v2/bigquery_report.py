@@ -1,9 +1,10 @@
 import collections
 import dataclasses
 import logging
+import threading
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Counter, Dict, List, Optional
+from typing import Counter, Dict, Iterable, List, Optional
 
 import pydantic
 
@@ -88,6 +89,32 @@ class BigQueryV2Report(ProfilingSqlReport):
     _timer: Optional[PerfTimer] = field(
         default=None, init=False, repr=False, compare=False
     )
+    # Guards report updates made from the dataset processing worker threads
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False, compare=False
+    )
+
+    def report_entity_scanned(self, name: str, ent_type: str = "table") -> None:
+        with self._lock:
+            super().report_entity_scanned(name, ent_type)
+
+    def report_dropped(self, ent_name: str) -> None:
+        with self._lock:
+            super().report_dropped(ent_name)
+
+    def report_dropped_bulk(self, ent_names: Iterable[str]) -> None:
+        # Takes the lock once for a whole batch of dropped entities
+        with self._lock:
+            for ent_name in ent_names:
+                super().report_dropped(ent_name)
+
+    def report_warning(self, key: str, reason: str) -> None:
+        with self._lock:
+            super().report_warning(key, reason)
+
+    def report_failure(self, key: str, reason: str) -> None:
+        with self._lock:
+            super().report_failure(key, reason)
 
     def set_ingestion_stage(self, project: str, stage: str) -> None:
         if self._timer:
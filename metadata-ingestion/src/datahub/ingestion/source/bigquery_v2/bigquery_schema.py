@@ -1,8 +1,9 @@
 import logging
+import sys
 from collections import defaultdict
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Any, Dict, Iterator, List, Optional
+from typing import Any, Callable, Dict, Iterator, List, Optional
 
 from google.cloud import bigquery
 from google.cloud.bigquery.table import (
@@ -361,10 +362,17 @@ class BigQueryDataDictionary:
 
     @staticmethod
     def get_datasets_for_project_id(
-        conn: bigquery.Client, project_id: str, maxResults: Optional[int] = None
+        conn: bigquery.Client,
+        project_id: str,
+        maxResults: Optional[int] = None,
+        dataset_filter: Optional[Callable[[str], bool]] = None,
     ) -> List[BigqueryDataset]:
         datasets = conn.list_datasets(project_id, max_results=maxResults)
-        return [BigqueryDataset(name=d.dataset_id, labels=d.labels) for d in datasets]
+        return [
+            BigqueryDataset(name=d.dataset_id, labels=d.labels)
+            for d in datasets
+            if dataset_filter is None or dataset_filter(d.dataset_id)
+        ]
 
     @staticmethod
     def get_datasets_for_project_id_with_information_schema(
@@ -580,7 +588,11 @@ class BigQueryDataDictionary:
                         ordinal_position=column.ordinal_position,
                         field_path=column.field_path,
                         is_nullable=column.is_nullable == "YES",
-                        data_type=column.data_type,
+                        # Column types repeat a lot, interning keeps a single copy of
+                        # each type in memory and speeds up the type mapping lookup
+                        data_type=sys.intern(column.data_type)
+                        if column.data_type
+                        else column.data_type,
                         comment=column.comment,
                         is_partition_column=column.is_partitioning_column == "YES",
                     )
@@ -618,7 +630,9 @@ class BigQueryDataDictionary:
                         ordinal_position=column.ordinal_position,
                         is_nullable=column.is_nullable == "YES",
                         field_path=column.field_path,
-                        data_type=column.data_type,
+                        data_type=sys.intern(column.data_type)
+                        if column.data_type
+                        else column.data_type,
                         comment=column.comment,
                         is_partition_column=column.is_partitioning_column == "YES",
                     )
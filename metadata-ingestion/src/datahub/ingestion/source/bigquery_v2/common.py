@@ -1,4 +1,5 @@
-from typing import Any, Dict, Optional
+import threading
+from typing import Any, Collection, Dict, Iterable, Iterator, Optional, Set, TypeVar
 
 from google.cloud import bigquery
 from google.cloud.logging_v2.client import Client as GCPLoggingClient
@@ -11,6 +12,35 @@ BQ_DATE_SHARD_FORMAT = "%Y%m%d"
 BQ_EXTERNAL_TABLE_URL_TEMPLATE = "https://console.cloud.google.com/bigquery?project={project}&ws=!1m5!1m4!4m3!1s{project}!2s{dataset}!3s{table}"
 BQ_EXTERNAL_DATASET_URL_TEMPLATE = "https://console.cloud.google.com/bigquery?project={project}&ws=!1m4!1m3!3m2!1s{project}!2s{dataset}"
 
+T = TypeVar("T")
+
+
+class ThreadSafeSet(Collection[T]):
+    """A set that can be added to from multiple threads."""
+
+    def __init__(self) -> None:
+        self._items: Set[T] = set()
+        self._lock = threading.Lock()
+
+    def add(self, item: T) -> None:
+        with self._lock:
+            self._items.add(item)
+
+    def add_many(self, items: Iterable[T]) -> None:
+        # Takes the lock once for the whole batch
+        with self._lock:
+            self._items.update(items)
+
+    def __contains__(self, item: object) -> bool:
+        return item in self._items
+
+    def __iter__(self) -> Iterator[T]:
+        with self._lock:
+            return iter(list(self._items))
+
+    def __len__(self) -> int:
+        return len(self._items)
+
 
 def _make_gcp_logging_client(
     project_id: Optional[str] = None, extra_client_options: Dict[str, Any] = {}
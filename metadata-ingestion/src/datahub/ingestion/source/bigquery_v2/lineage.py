@@ -174,7 +174,11 @@ timestamp < "{end_time}"
                 project_tables.extend(
                     [
                         table
-                        for table in bigquery_client.list_tables(dataset.dataset_id)
+                        # Qualified with project_id, as the client's default
+                        # project may not be the one being ingested
+                        for table in bigquery_client.list_tables(
+                            f"{project_id}.{dataset.dataset_id}"
+                        )
                         if table.table_type in ["TABLE", "VIEW", "MATERIALIZED_VIEW"]
                     ]
                 )
@@ -19,6 +19,9 @@ from datahub.ingestion.source.state.stateful_ingestion_base import (
     StatefulIngestionConfigBase,
 )
 
+# Matches a {variable} in a naming pattern, capturing the variable name
+_NAMING_PATTERN_VARIABLE_REGEX = re.compile(r"{([^}{]+)}")
+
 
 class NamingPattern(ConfigModel):
     ALLOWED_VARS: ClassVar[List[str]] = []
@@ -50,9 +53,7 @@ class NamingPattern(ConfigModel):
         return f"Allowed variables are {cls.ALLOWED_VARS}"
 
     def validate_pattern(self, at_least_one: bool) -> bool:
-        variables = re.findall("({[^}{]+})", self.pattern)
-
-        variables = [v[1:-1] for v in variables]  # remove the {}
+        variables = _NAMING_PATTERN_VARIABLE_REGEX.findall(self.pattern)
 
         for v in variables:
             if v not in self.ALLOWED_VARS:
@@ -66,11 +67,17 @@ class NamingPattern(ConfigModel):
         return True
 
     def replace_variables(self, values: Union[Dict[str, Optional[str]], object]) -> str:
-        if not isinstance(values, dict):
+        if isinstance(values, dict):
+            values = {k: v for k, v in values.items() if v is not None}
+        else:
             # Check that this is a dataclass instance (not a dataclass type).
             assert dataclasses.is_dataclass(values) and not isinstance(values, type)
-            values = dataclasses.asdict(values)
-        values = {k: v for k, v in values.items() if v is not None}
+            # Shallow read of the fields, asdict would deep copy every value
+            fields = (
+                (field.name, getattr(values, field.name))
+                for field in dataclasses.fields(values)
+            )
+            values = {k: v for k, v in fields if v is not None}
         return self.pattern.format(**values)
 
 
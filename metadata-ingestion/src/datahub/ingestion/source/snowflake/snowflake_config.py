@@ -21,7 +21,7 @@ from datahub.ingestion.source_config.sql.snowflake import (
 )
 from datahub.ingestion.source_config.usage.snowflake_usage import SnowflakeUsageConfig
 
-logger = logging.Logger(__name__)
+logger = logging.getLogger(__name__)
 
 # FIVETRAN creates temporary tables in schema named FIVETRAN_xxx_STAGING.
 # Ref - https://support.fivetran.com/hc/en-us/articles/1500003507122-Why-Is-There-an-Empty-Schema-Named-Fivetran-staging-in-the-Destination-
@@ -35,6 +35,8 @@ DEFAULT_UPSTREAMS_DENY_LIST = [
     rf".*\.STAGING_.*_{UUID_REGEX}",  # stitch
 ]
 
+INFORMATION_SCHEMA_DENY_PATTERN = r".*INFORMATION_SCHEMA$"
+
 
 class TagOption(str, Enum):
     with_lineage = "with_lineage"
@@ -143,9 +145,16 @@ class SnowflakeV2Config(
             )
 
         # Always exclude reporting metadata for INFORMATION_SCHEMA schema
-        if schema_pattern is not None and schema_pattern:
+        # The pattern object may be shared between configs, so only add it once
+        if (
+            schema_pattern is not None
+            and schema_pattern
+            and INFORMATION_SCHEMA_DENY_PATTERN not in schema_pattern.deny
+        ):
             logger.debug("Adding deny for INFORMATION_SCHEMA to schema_pattern.")
-            cast(AllowDenyPattern, schema_pattern).deny.append(r".*INFORMATION_SCHEMA$")
+            cast(AllowDenyPattern, schema_pattern).deny.append(
+                INFORMATION_SCHEMA_DENY_PATTERN
+            )
 
         include_technical_schema = values.get("include_technical_schema")
         include_profiles = (
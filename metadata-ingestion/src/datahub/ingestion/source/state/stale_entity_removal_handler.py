@@ -1,7 +1,7 @@
 import logging
 from dataclasses import dataclass, field
 from functools import partial
-from typing import Dict, Iterable, Optional, Set, Type, cast
+from typing import Dict, Iterable, Optional, Set, Tuple, Type, cast
 
 import pydantic
 
@@ -204,6 +204,10 @@ class StaleEntityRemovalHandler(
 
         self._urns_to_skip.add(urn)
 
+    def add_urns_to_skip(self, urns: Iterable[str]) -> None:
+        """Bulk version of add_urn_to_skip."""
+        self._urns_to_skip.update(urns)
+
     def gen_removed_entity_workunits(self) -> Iterable[MetadataWorkUnit]:
         if not self.is_checkpointing_enabled() or self._ignore_old_state():
             return
@@ -279,3 +283,16 @@ class StaleEntityRemovalHandler(
         assert cur_checkpoint is not None
         cur_state = cast(GenericCheckpointState, cur_checkpoint.state)
         cur_state.add_checkpoint_urn(type=type, urn=urn)
+
+    def add_entities_to_state_bulk(self, entities: Iterable[Tuple[str, str]]) -> None:
+        """Bulk version of add_entity_to_state, taking (type, urn) pairs.
+
+        Only looks up the current checkpoint once per call.
+        """
+        if not self.is_checkpointing_enabled() or self._ignore_new_state():
+            return
+        cur_checkpoint = self.state_provider.get_current_checkpoint(self.job_id)
+        assert cur_checkpoint is not None
+        cur_state = cast(GenericCheckpointState, cur_checkpoint.state)
+        for type, urn in entities:
+            cur_state.add_checkpoint_urn(type=type, urn=urn)
@@ -1,9 +1,11 @@
+import functools
 import urllib.parse
 from typing import List
 
 from datahub.utilities.urns.error import InvalidUrnError
 
 
+@functools.lru_cache(maxsize=100_000)
 def guess_entity_type(urn: str) -> str:
     assert urn.startswith("urn:li:"), "urns must start with urn:li:"
     return urn.split(":")[2]
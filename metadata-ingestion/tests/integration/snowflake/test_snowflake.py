@@ -30,26 +30,22 @@ from datahub.ingestion.source.snowflake.snowflake_report import SnowflakeV2Repor
 from tests.integration.snowflake.common import FROZEN_TIME, default_query_results
 from tests.test_helpers import mce_helpers
 
+CLOUD_REGION_PREFIXES = ("af", "ap", "ca", "eu", "me", "sa", "us")
+CLOUD_REGION_DIRECTIONS = ("central", "north", "south", "east", "west")
+
 
 def random_email():
     return (
-        "".join(
-            [
-                random.choice(string.ascii_lowercase)
-                for i in range(random.randint(10, 15))
-            ]
-        )
+        "".join(random.choices(string.ascii_lowercase, k=random.randint(10, 15)))
         + "@xyz.com"
     )
 
 
 def random_cloud_region():
-    return "".join(
+    return "-".join(
         [
-            random.choice(["af", "ap", "ca", "eu", "me", "sa", "us"]),
-            "-",
-            random.choice(["central", "north", "south", "east", "west"]),
-            "-",
+            random.choice(CLOUD_REGION_PREFIXES),
+            random.choice(CLOUD_REGION_DIRECTIONS),
             str(random.randint(1, 2)),
         ]
     )
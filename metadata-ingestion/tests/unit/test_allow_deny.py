@@ -1,3 +1,7 @@
+import re
+
+import pytest
+
 from datahub.configuration.common import AllowDenyPattern
 
 
@@ -49,3 +53,46 @@ def test_case_sensitivity():
     pattern = AllowDenyPattern(allow=["Foo.myTable"], ignoreCase=False)
     assert not pattern.allowed("foo.mytable")
     assert pattern.allowed("Foo.myTable")
+
+
+def test_multiple_patterns():
+    pattern = AllowDenyPattern(allow=["foo$", "bar"], deny=["bar.secret"])
+    assert pattern.allowed("foo")
+    assert not pattern.allowed("foo.table")
+    assert pattern.allowed("bar.table")
+    assert not pattern.allowed("bar.secret")
+
+
+def test_patterns_with_group_references():
+    pattern = AllowDenyPattern(allow=["foo", "(a)\\1"])
+    assert pattern.allowed("aa")
+    assert not pattern.allowed("ab")
+
+
+def test_patterns_with_conditional_group_references():
+    # (?(1)...) must keep referring to the pattern's own first group
+    pattern = AllowDenyPattern(allow=["(x)y", "(a)?(?(1)b|c)$"])
+    assert pattern.allowed("ab")
+    assert pattern.allowed("c")
+    assert not pattern.allowed("ac")
+
+
+def test_invalid_pattern_raises() -> None:
+    # Would compile, and match "b", if it were combined with the other patterns
+    pattern = AllowDenyPattern(allow=["foo", "a)|(?:b"])
+    with pytest.raises(re.error):
+        pattern.allowed("b")
+
+
+def test_patterns_added_after_first_match() -> None:
+    pattern = AllowDenyPattern(allow=["foo"], deny=["bar"])
+    assert pattern.allowed("foo.table")
+    pattern.deny.append("foo.table")
+    assert not pattern.allowed("foo.table")
+
+
+def test_allow_all_with_deny() -> None:
+    pattern = AllowDenyPattern(deny=["foo.*"])
+    assert pattern.allowed("bar.table")
+    assert pattern.allowed("")
+    assert not pattern.allowed("foo.table")
@@ -1,5 +1,7 @@
 import datetime
+from types import SimpleNamespace
 from typing import Dict, List, Set
+from unittest.mock import patch
 
 from datahub.ingestion.source.bigquery_v2.bigquery_audit import (
     BigQueryTableRef,
@@ -174,3 +176,30 @@ def test_lineage_with_timestamps():
     )
     assert upstream_lineage
     assert len(upstream_lineage[0].upstreams) == 4
+
+
+@patch("datahub.ingestion.source.bigquery_v2.lineage.lineage_v1.LineageClient")
+@patch("datahub.ingestion.source.bigquery_v2.lineage.get_bigquery_client")
+def test_lineage_via_catalog_lineage_api_lists_tables_of_project(
+    get_bigquery_client_mock, lineage_client_mock
+):
+    bigquery_client = get_bigquery_client_mock.return_value
+    bigquery_client.list_datasets.return_value = [
+        SimpleNamespace(dataset_id="test-dataset")
+    ]
+    bigquery_client.list_tables.return_value = [
+        SimpleNamespace(
+            table_type="TABLE",
+            project="test-project",
+            dataset_id="test-dataset",
+            table_id="test-table",
+        )
+    ]
+    lineage_client_mock.return_value.search_links.return_value = []
+
+    extractor = BigqueryLineageExtractor(BigQueryV2Config(), BigQueryV2Report())
+    assert extractor.lineage_via_catalog_lineage_api("test-project") == {}
+
+    # Datasets are listed in the ingested project, not the client's default one
+    bigquery_client.list_datasets.assert_called_once_with("test-project")
+    bigquery_client.list_tables.assert_called_once_with("test-project.test-dataset")
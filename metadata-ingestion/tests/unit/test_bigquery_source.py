@@ -1,6 +1,8 @@
 import json
 import logging
 import os
+import threading
+import time
 from datetime import datetime, timedelta, timezone
 from types import SimpleNamespace
 from typing import Any, Dict, Optional, cast
@@ -11,7 +13,10 @@ from google.api_core.exceptions import GoogleAPICallError
 from google.cloud.bigquery.table import Row, TableListItem
 
 from datahub.ingestion.api.common import PipelineContext
-from datahub.ingestion.source.bigquery_v2.bigquery import BigqueryV2Source
+from datahub.ingestion.source.bigquery_v2.bigquery import (
+    BigqueryV2Source,
+    _sanitized_table_ref,
+)
 from datahub.ingestion.source.bigquery_v2.bigquery_audit import (
     BigqueryTableIdentifier,
     BigQueryTableRef,
@@ -19,9 +24,11 @@ from datahub.ingestion.source.bigquery_v2.bigquery_audit import (
 from datahub.ingestion.source.bigquery_v2.bigquery_config import BigQueryV2Config
 from datahub.ingestion.source.bigquery_v2.bigquery_schema import (
     BigQueryDataDictionary,
+    BigqueryDataset,
     BigqueryProject,
     BigqueryView,
 )
+from datahub.ingestion.source.bigquery_v2.common import ThreadSafeSet
 from datahub.ingestion.source.bigquery_v2.lineage import LineageEdge
 from datahub.metadata.com.linkedin.pegasus2avro.dataset import ViewProperties
 from datahub.metadata.schema_classes import MetadataChangeProposalClass
@@ -76,16 +83,11 @@ def test_bigquery_uri_with_credential():
 
         with open(config._credentials_path) as jsonFile:
             json_credential = json.load(jsonFile)
-            jsonFile.close()
-
-        credential = json.dumps(json_credential, sort_keys=True)
-        expected_credential = json.dumps(expected_credential_json, sort_keys=True)
-        assert expected_credential == credential
 
-    except AssertionError as e:
+        assert json_credential == expected_credential_json
+    finally:
         if config._credentials_path:
-            os.unlink(str(config._credentials_path))
-        raise e
+            os.unlink(config._credentials_path)
 
 
 @patch("google.cloud.bigquery.client.Client")
@@ -318,9 +320,10 @@ def test_upstream_table_generation_with_temporary_table_with_temp_upstream():
     )
 
     source = BigqueryV2Source(config=config, ctx=PipelineContext(run_id="test"))
+    now = datetime.now()
     lineage_metadata = {
-        str(a): {LineageEdge(table=str(b), auditStamp=datetime.now())},
-        str(b): {LineageEdge(table=str(c), auditStamp=datetime.now())},
+        str(a): {LineageEdge(table=str(b), auditStamp=now)},
+        str(b): {LineageEdge(table=str(c), auditStamp=now)},
     }
     upstreams = source.lineage_extractor.get_upstream_tables(a, lineage_metadata, [])
     assert len(upstreams) == 1
@@ -360,17 +363,17 @@ def test_upstream_table_generation_with_temporary_table_with_multiple_temp_upstr
         }
     )
     source = BigqueryV2Source(config=config, ctx=PipelineContext(run_id="test"))
+    now = datetime.now()
     lineage_metadata = {
-        str(a): {LineageEdge(table=str(b), auditStamp=datetime.now())},
+        str(a): {LineageEdge(table=str(b), auditStamp=now)},
         str(b): {
-            LineageEdge(table=str(c), auditStamp=datetime.now()),
-            LineageEdge(table=str(d), auditStamp=datetime.now()),
+            LineageEdge(table=str(c), auditStamp=now),
+            LineageEdge(table=str(d), auditStamp=now),
         },
-        str(d): {LineageEdge(table=str(e), auditStamp=datetime.now())},
+        str(d): {LineageEdge(table=str(e), auditStamp=now)},
     }
     upstreams = source.lineage_extractor.get_upstream_tables(a, lineage_metadata, [])
-    sorted_list = list(upstreams)
-    sorted_list.sort()
+    sorted_list = sorted(upstreams, key=lambda upstream: upstream.table)
     assert sorted_list[0].table == str(c)
     assert sorted_list[1].table == str(e)
 
@@ -446,6 +449,21 @@ def test_table_processing_logic(client_mock, data_dictionary_mock):
         assert table in ["test-table", "test-sharded-table_20220102"]
 
 
+@patch("google.cloud.bigquery.client.Client")
+def test_list_tables(client_mock):
+    table_list_items = iter([])
+    client_mock.list_tables.return_value = table_list_items
+
+    # Tables are streamed from the API rather than collected up front
+    assert (
+        BigqueryV2Source._list_tables(client_mock, "test-project", "test-dataset")
+        is table_list_items
+    )
+    client_mock.list_tables.assert_called_once_with(
+        "test-project.test-dataset", page_size=1000
+    )
+
+
 @patch(
     "datahub.ingestion.source.bigquery_v2.bigquery_schema.BigQueryDataDictionary.get_tables_for_dataset"
 )
@@ -518,18 +536,56 @@ def test_table_processing_logic_date_named_tables(client_mock, data_dictionary_m
         assert tables[table].table_id in ["test-table", "20220103"]
 
 
+@patch(
+    "datahub.ingestion.source.bigquery_v2.bigquery_schema.BigQueryDataDictionary.get_tables_for_dataset"
+)
+@patch("google.cloud.bigquery.client.Client")
+def test_table_processing_logic_parallel_batches(client_mock, data_dictionary_mock):
+    config = BigQueryV2Config.parse_obj(
+        {
+            "project_id": "test-project",
+            "number_of_datasets_process_in_batch": 2,
+            "number_of_parallel_metadata_fetch": 2,
+        }
+    )
+
+    client_mock.list_tables.return_value = [
+        TableListItem(
+            {
+                "tableReference": {
+                    "projectId": "test-project",
+                    "datasetId": "test-dataset",
+                    "tableId": f"test-table-{i}",
+                }
+            }
+        )
+        for i in range(5)
+    ]
+    data_dictionary_mock.side_effect = (
+        lambda conn, project_id, dataset_name, tables, **kwargs: iter(
+            list(tables.keys())
+        )
+    )
+
+    source = BigqueryV2Source(config=config, ctx=PipelineContext(run_id="test"))
+
+    tables = list(
+        source.get_tables_for_dataset(
+            conn=client_mock, project_id="test-project", dataset_name="test-dataset"
+        )
+    )
+
+    assert data_dictionary_mock.call_count == 3
+    assert tables == [f"test-table-{i}" for i in range(5)]
+
+
 def create_row(d: Dict[str, Any]) -> Row:
-    values = []
-    field_to_index = {}
-    for i, (k, v) in enumerate(d.items()):
-        field_to_index[k] = i
-        values.append(v)
-    return Row(tuple(values), field_to_index)
+    return Row(tuple(d.values()), {k: i for i, k in enumerate(d)})
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def bigquery_view_1() -> BigqueryView:
-    now = datetime.now(tz=timezone.utc)
+    now = datetime(2023, 1, 1, tzinfo=timezone.utc)
     return BigqueryView(
         name="table1",
         created=now - timedelta(days=10),
@@ -540,9 +596,9 @@ def bigquery_view_1() -> BigqueryView:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def bigquery_view_2() -> BigqueryView:
-    now = datetime.now(tz=timezone.utc)
+    now = datetime(2023, 1, 1, tzinfo=timezone.utc)
     return BigqueryView(
         name="table2",
         created=now,
@@ -594,6 +650,21 @@ def test_get_views_for_dataset(
     assert list(views) == [bigquery_view_1, bigquery_view_2]
 
 
+@patch("google.cloud.bigquery.client.Client")
+def test_get_datasets_for_project_id_with_dataset_filter(client_mock: Mock) -> None:
+    client_mock.list_datasets.return_value = [
+        SimpleNamespace(dataset_id="allowed-dataset", labels={}),
+        SimpleNamespace(dataset_id="denied-dataset", labels={}),
+    ]
+
+    datasets = BigQueryDataDictionary.get_datasets_for_project_id(
+        client_mock,
+        "test-project",
+        dataset_filter=lambda name: name.startswith("allowed"),
+    )
+    assert [d.name for d in datasets] == ["allowed-dataset"]
+
+
 @patch.object(BigqueryV2Source, "gen_dataset_workunits", lambda *args, **kwargs: [])
 def test_gen_view_dataset_workunits(bigquery_view_1, bigquery_view_2):
     project_id = "test-project"
@@ -730,3 +801,158 @@ def test_get_table_name(full_table_name: str, datahub_full_table_name: str) -> N
             BigqueryTableIdentifier.from_string_name(full_table_name).get_table_name()
             == datahub_full_table_name
         )
+
+
+@pytest.mark.parametrize(
+    "table",
+    [
+        "table",
+        "table_20231215",
+        "table@1624046611000",
+        "table_2023*",
+        "table20231215",
+        "20230112",
+    ],
+)
+def test_get_sanitized_table_name_matches_sanitized_table_ref(table: str) -> None:
+    identifier = BigqueryTableIdentifier("project", "dataset", table)
+    sanitized_table_ref = BigQueryTableRef(identifier).get_sanitized_table_ref()
+    assert (
+        f"projects/project/datasets/dataset/tables/{identifier.get_sanitized_table_name()}"
+        == str(sanitized_table_ref)
+    )
+
+
+def test_sanitized_table_ref_follows_sharded_table_pattern() -> None:
+    identifier = BigqueryTableIdentifier("project", "dataset", "table_2023")
+
+    # The sharded table settings are class attributes set by each source
+    with patch.object(
+        BigqueryTableIdentifier,
+        "_BIGQUERY_DEFAULT_SHARDED_TABLE_REGEX",
+        BigqueryTableIdentifier._BIGQUERY_DEFAULT_SHARDED_TABLE_REGEX,
+    ), patch.object(
+        BigqueryTableIdentifier,
+        "_BQ_SHARDED_TABLE_SUFFIX",
+        BigqueryTableIdentifier._BQ_SHARDED_TABLE_SUFFIX,
+    ):
+        BigqueryV2Source(
+            config=BigQueryV2Config.parse_obj({"project_id": "project"}),
+            ctx=PipelineContext(run_id="test"),
+        )
+        assert (
+            _sanitized_table_ref(identifier)
+            == "projects/project/datasets/dataset/tables/table_2023"
+        )
+
+        BigqueryV2Source(
+            config=BigQueryV2Config.parse_obj(
+                {
+                    "project_id": "project",
+                    "sharded_table_pattern": "((.+)[_$])?(\\d{4,10})$",
+                }
+            ),
+            ctx=PipelineContext(run_id="test"),
+        )
+        assert (
+            _sanitized_table_ref(identifier)
+            == "projects/project/datasets/dataset/tables/table"
+        )
+
+
+def test_thread_safe_set():
+    table_refs: ThreadSafeSet[str] = ThreadSafeSet()
+    table_refs.add("a")
+    table_refs.add_many(["b", "c", "a"])
+
+    assert len(table_refs) == 3
+    assert "b" in table_refs
+    assert "d" not in table_refs
+    assert sorted(table_refs) == ["a", "b", "c"]
+
+
+def test_process_datasets_in_parallel_keeps_dataset_order():
+    config = BigQueryV2Config.parse_obj(
+        {"project_id": "test-project", "max_threads_dataset_parallelism": 4}
+    )
+    source = BigqueryV2Source(config=config, ctx=PipelineContext(run_id="test"))
+    datasets = [BigqueryDataset(name=f"dataset-{i}") for i in range(10)]
+
+    def process_dataset(conn, project_id, bigquery_dataset, db_tables, db_views):
+        # Later datasets finish first
+        time.sleep(0.01 * (10 - int(bigquery_dataset.name.split("-")[1])))
+        for i in range(3):
+            yield f"{bigquery_dataset.name}-wu-{i}"
+
+    with patch.object(source, "_process_dataset", side_effect=process_dataset):
+        workunits = list(
+            source._process_datasets_in_parallel(
+                MagicMock(), "test-project", datasets, {}, {}
+            )
+        )
+    assert workunits == [f"dataset-{i}-wu-{j}" for i in range(10) for j in range(3)]
+
+
+def test_process_schema_streams_tables():
+    config = BigQueryV2Config.parse_obj({"project_id": "test-project"})
+    source = BigqueryV2Source(config=config, ctx=PipelineContext(run_id="test"))
+    fetched_tables = []
+
+    def get_tables_for_dataset(conn, project_id, dataset_name):
+        for name in ["table-1", "table-2"]:
+            fetched_tables.append(name)
+            yield SimpleNamespace(name=name)
+
+    def process_table(table, columns, project_id, dataset_name):
+        yield f"{table.name}-wu"
+
+    db_tables: Dict[str, Any] = {}
+    with patch.object(
+        source, "get_tables_for_dataset", side_effect=get_tables_for_dataset
+    ), patch.object(source, "_process_table", side_effect=process_table), patch.object(
+        source, "gen_dataset_containers", return_value=[]
+    ), patch.object(
+        BigQueryDataDictionary, "get_columns_for_dataset", return_value={}
+    ), patch.object(
+        BigQueryDataDictionary, "get_views_for_dataset", return_value=[]
+    ):
+        workunits = iter(
+            source._process_schema(
+                MagicMock(),
+                "test-project",
+                BigqueryDataset(name="dataset"),
+                db_tables,
+                {},
+            )
+        )
+        # The first table is emitted before the next one is fetched
+        assert next(workunits) == "table-1-wu"
+        assert fetched_tables == ["table-1"]
+        assert list(workunits) == ["table-2-wu"]
+
+    # Tables are only kept around for the profiler
+    assert db_tables == {"dataset": []}
+
+
+def test_process_datasets_in_parallel_streams_workunits():
+    config = BigQueryV2Config.parse_obj(
+        {"project_id": "test-project", "max_threads_dataset_parallelism": 2}
+    )
+    source = BigqueryV2Source(config=config, ctx=PipelineContext(run_id="test"))
+    first_consumed = threading.Event()
+
+    def process_dataset(conn, project_id, bigquery_dataset, db_tables, db_views):
+        yield f"{bigquery_dataset.name}-first"
+        # Only finishes once its first workunit has reached the consumer
+        assert first_consumed.wait(timeout=10)
+        yield f"{bigquery_dataset.name}-last"
+
+    with patch.object(source, "_process_dataset", side_effect=process_dataset):
+        workunits = iter(
+            source._process_datasets_in_parallel(
+                MagicMock(), "test-project", [BigqueryDataset(name="dataset")], {}, {}
+            )
+        )
+        assert next(workunits) == "dataset-first"
+        first_consumed.set()
+        assert list(workunits) == ["dataset-last"]
@@ -3,6 +3,7 @@ from unittest.mock import MagicMock, patch
 import pytest
 from pydantic import ValidationError
 
+from datahub.configuration.common import AllowDenyPattern
 from datahub.configuration.oauth import OAuthConfiguration
 from datahub.configuration.pattern_utils import UUID_REGEX
 from datahub.ingestion.api.source import SourceCapability
@@ -13,6 +14,7 @@ from datahub.ingestion.source.snowflake.constants import (
 )
 from datahub.ingestion.source.snowflake.snowflake_config import (
     DEFAULT_UPSTREAMS_DENY_LIST,
+    INFORMATION_SCHEMA_DENY_PATTERN,
     SnowflakeV2Config,
 )
 from datahub.ingestion.source.snowflake.snowflake_query import (
@@ -153,6 +155,22 @@ def test_account_id_is_added_when_host_port_is_present():
     assert config.account_id == "acctname"
 
 
+def test_information_schema_deny_added_once_for_shared_schema_pattern():
+    schema_pattern = AllowDenyPattern(allow=["^demo$"])
+    for _ in range(3):
+        config = SnowflakeV2Config.parse_obj(
+            {
+                "username": "user",
+                "password": "password",
+                "account_id": "acctname",
+                "schema_pattern": schema_pattern,
+                "warehouse": "COMPUTE_WH",
+                "role": "sysadmin",
+            }
+        )
+        assert config.schema_pattern.deny.count(INFORMATION_SCHEMA_DENY_PATTERN) == 1
+
+
 def test_account_id_with_snowflake_host_suffix():
     config = SnowflakeV2Config.parse_obj(
         {
@@ -1,5 +1,5 @@
 from typing import Any, Dict, Iterable, List, Union
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import datahub.metadata.schema_classes as models
 from datahub.emitter.mce_builder import (
@@ -10,7 +10,10 @@ from datahub.emitter.mce_builder import (
 from datahub.emitter.mcp import MetadataChangeProposalWrapper
 from datahub.ingestion.api.source_helpers import (
     auto_browse_path_v2,
+    auto_materialize_referenced_tags,
+    auto_stale_entity_removal,
     auto_status_aspect,
+    auto_status_aspect_and_referenced_tags,
     auto_workunit,
 )
 from datahub.ingestion.api.workunit import MetadataWorkUnit
@@ -87,6 +90,55 @@ def test_auto_status_aspect():
     assert list(auto_status_aspect(initial_wu)) == expected
 
 
+def test_auto_status_aspect_and_referenced_tags():
+    initial_wu = list(
+        auto_workunit(
+            [
+                *_base_metadata,
+                MetadataChangeProposalWrapper(
+                    entityUrn="urn:li:container:008e111aa1d250dd52e0fd5d4b307b1a",
+                    aspect=models.GlobalTagsClass(
+                        tags=[
+                            models.TagAssociationClass(tag="urn:li:tag:referenced"),
+                            models.TagAssociationClass(tag="urn:li:tag:existing"),
+                        ]
+                    ),
+                ),
+                MetadataChangeProposalWrapper(
+                    entityUrn="urn:li:tag:existing",
+                    aspect=models.TagPropertiesClass(name="existing"),
+                ),
+            ]
+        )
+    )
+
+    expected = list(auto_materialize_referenced_tags(auto_status_aspect(initial_wu)))
+    assert list(auto_status_aspect_and_referenced_tags(initial_wu)) == expected
+    assert expected[-1].get_urn() == "urn:li:tag:referenced"
+
+
+def test_auto_stale_entity_removal_records_entities_when_closed_early():
+    initial_wu = list(auto_workunit(_base_metadata))
+    handler = MagicMock()
+
+    stream = auto_stale_entity_removal(handler, initial_wu)
+    assert next(stream) == initial_wu[0]
+    assert next(stream) == initial_wu[1]
+    stream.close()
+
+    # The workunits handed out so far are in the state, later ones and removals aren't
+    recorded = [
+        entity
+        for call in handler.add_entities_to_state_bulk.call_args_list
+        for entity in call[0][0]
+    ]
+    assert recorded == [
+        ("container", initial_wu[0].get_urn()),
+        ("container", initial_wu[1].get_urn()),
+    ]
+    handler.gen_removed_entity_workunits.assert_not_called()
+
+
 def _create_container_aspects(
     d: Dict[str, Any],
     other_aspects: Dict[str, List[models._Aspect]] = {},